@@ -106,5 +106,10 @@ async def find_missing_file_ids():
         print(f"   - {task_id}")
 
 if __name__ == "__main__":
+    try:
+        import uvloop  # 설치되어 있으면 libuv 기반 이벤트 루프로 다운로드 처리
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(download_failed_videos())
     # asyncio.run(find_missing_file_ids()) 
\ No newline at end of file
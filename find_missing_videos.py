@@ -123,4 +123,9 @@ async def manual_task_check():
         # task_id 확인 로직...
 
 if __name__ == "__main__":
+    try:
+        import uvloop  # 설치되어 있으면 libuv 기반 이벤트 루프로 다운로드 처리
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     asyncio.run(find_and_download_missing_videos()) 
\ No newline at end of file
@@ -14,6 +14,7 @@ import uuid
 from dotenv import load_dotenv
 import warnings
 import shutil
+import logging
 
 # 경고 메시지 무시
 warnings.filterwarnings("ignore", message="urllib3")
@@ -27,9 +28,18 @@ from services.openai_service import OpenAIService
 from services.minimax_service import MinimaxService
 from services.file_manager import FileManager
 from services.prompts.life_prompts import LifePromptsService
+from services.openai_service_backup import close_client as close_openai_client
+from services.minimax_service_backup import close_sessions as close_minimax_sessions
 
 load_dotenv()
 
+# 서비스 모듈 로그를 print 출력과 같은 stdout으로 (레벨은 LOG_LEVEL, 기본 INFO)
+logging.basicConfig(
+    stream=sys.stdout,
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
+    format="%(message)s",
+)
+
 app = FastAPI(title="YouTube Shorts Automation MVP")
 
 # CORS 설정
@@ -77,6 +87,13 @@ minimax_service = MinimaxService()
 file_manager = FileManager()
 life_prompts_service = LifePromptsService()
 
+@app.on_event("shutdown")
+async def shutdown_services():
+    """앱 종료 시 서비스 자원 정리 (이미지 인코딩 프로세스 풀, 공유 OpenAI 클라이언트/Minimax 세션 연결)"""
+    openai_service.close()
+    await close_openai_client()
+    await close_minimax_sessions()
+
 # 요청/응답 모델
 class ProjectRequest(BaseModel):
     description: str
@@ -1810,5 +1827,5 @@ if __name__ == "__main__":
     print(f"Working directory: {os.getcwd()}")
     print(f"Project root: {project_root}")
     
-    # reload 없이 실행 (경고 없음)
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # reload 없이 실행 (경고 없음), uvloop이 설치되어 있으면 이벤트 루프로 사용
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="auto")
\ No newline at end of file
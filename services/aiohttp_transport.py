@@ -0,0 +1,188 @@
+# app/services/aiohttp_transport.py
+import asyncio
+from typing import Optional
+
+import aiohttp
+import httpx
+
+# 요청 본문을 나눠 보내는 단위 - 청크마다 쓰기 타임아웃을 다시 잼 (httpx의 write 타임아웃과 같은 의미)
+_WRITE_CHUNK = 65536
+
+class _RequestPhase:
+    """요청이 어느 단계(pool/connect/write/read)에 있는지 기록 - 타임아웃을 단계별 httpx 예외로 바꾸기 위해 사용"""
+
+    def __init__(self, write_timeout: Optional[float]):
+        self.stage = "connect"
+        self.write_timed_out = False
+        self._finished = False
+        self._write_timeout = write_timeout
+        self._write_handle: Optional[asyncio.TimerHandle] = None
+        self._task = asyncio.current_task()
+
+    def arm_write_timer(self):
+        """청크 하나를 보내기 전에 호출 - 제한 시간 안에 다음 청크를 요청받지 못하면 요청 태스크 취소"""
+        self.stage = "write"
+        self.disarm_write_timer()
+        # 서버가 본문을 다 받기 전에 응답한 경우 요청 태스크는 이미 다른 일을 하므로 타이머를 걸지 않음
+        if self._write_timeout is not None and not self._finished:
+            self._write_handle = asyncio.get_running_loop().call_later(self._write_timeout, self._on_write_timeout)
+
+    def disarm_write_timer(self):
+        if self._write_handle is not None:
+            self._write_handle.cancel()
+            self._write_handle = None
+
+    def finish(self):
+        """응답 헤더를 받았거나 요청이 실패한 뒤 호출 - 이후로는 요청 태스크를 취소하지 않음"""
+        self._finished = True
+        self.disarm_write_timer()
+
+    def _on_write_timeout(self):
+        self.write_timed_out = True
+        self._task.cancel()
+
+    def write_timeout_error(self, request: httpx.Request) -> httpx.WriteTimeout:
+        """쓰기 타임아웃으로 직접 취소한 경우 - 취소 요청을 되돌리고 타임아웃으로 보고"""
+        if hasattr(self._task, "uncancel"):
+            self._task.uncancel()
+        return httpx.WriteTimeout("Timeout on writing request body", request=request)
+
+    def timeout_error(self, message: str, request: httpx.Request) -> httpx.TimeoutException:
+        if self.stage == "pool":
+            return httpx.PoolTimeout(message, request=request)
+        if self.stage == "connect":
+            return httpx.ConnectTimeout(message, request=request)
+        return httpx.ReadTimeout(message, request=request)
+
+async def _iter_body(body: bytes, phase: _RequestPhase):
+    """요청 본문을 청크 단위로 전달 (aiohttp는 이전 청크를 다 보낸 뒤에 다음 청크를 요청함)"""
+    try:
+        for offset in range(0, len(body), _WRITE_CHUNK):
+            phase.arm_write_timer()
+            yield body[offset:offset + _WRITE_CHUNK]
+    finally:
+        phase.disarm_write_timer()
+    # 본문 전송 완료 - 이후 타임아웃은 응답 대기(sock_read)
+    phase.stage = "read"
+
+def _phase_trace_config() -> aiohttp.TraceConfig:
+    """연결 대기/연결 생성 단계를 요청별 _RequestPhase(trace_request_ctx)에 기록하는 트레이스 설정"""
+    trace = aiohttp.TraceConfig()
+
+    def on_stage(stage: str):
+        async def callback(session, ctx, params):
+            if isinstance(ctx.trace_request_ctx, _RequestPhase):
+                ctx.trace_request_ctx.stage = stage
+        return callback
+
+    trace.on_connection_queued_start.append(on_stage("pool"))
+    trace.on_connection_queued_end.append(on_stage("connect"))
+    trace.on_connection_create_end.append(on_stage("read"))
+    trace.on_connection_reuseconn.append(on_stage("read"))
+    return trace
+
+class _AiohttpResponseStream(httpx.AsyncByteStream):
+    """aiohttp 응답 본문을 httpx 응답 스트림으로 전달 (SDK 스트리밍 응답도 그대로 동작)"""
+
+    def __init__(self, response: aiohttp.ClientResponse):
+        self._response = response
+
+    async def __aiter__(self):
+        try:
+            async for chunk in self._response.content.iter_chunked(65536):
+                yield chunk
+        except asyncio.TimeoutError as e:
+            raise httpx.ReadTimeout(str(e)) from e
+        except aiohttp.ClientError as e:
+            raise httpx.ReadError(str(e)) from e
+
+    async def aclose(self):
+        # 본문을 끝까지 읽었으면 연결은 풀로 돌아감
+        self._response.release()
+
+class AiohttpTransport(httpx.AsyncBaseTransport):
+    """httpx 요청을 aiohttp 세션으로 보내는 전송 계층 (OpenAI SDK의 http_client에 주입)
+
+    httpx 기본 연결 풀은 동시 요청이 많아지면 풀 잠금 경합으로 처리량이 떨어지므로
+    실제 송수신은 aiohttp 커넥터가 담당
+    """
+
+    def __init__(self, limit: int = 100, keepalive_timeout: float = 60):
+        self._limit = limit
+        self._keepalive_timeout = keepalive_timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """현재 이벤트 루프용 세션 (서비스는 루프 시작 전에 생성되므로 첫 요청 때 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            if self._session is not None and not self._session.closed:
+                # 이전 루프(asyncio.run 호출이 끝난 경우 등)의 세션은 연결을 정리한 뒤 교체
+                await self._close_stale_session(self._session)
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._limit, keepalive_timeout=self._keepalive_timeout),
+                trace_configs=[_phase_trace_config()],
+                # 압축 해제는 httpx가 Content-Encoding을 보고 처리
+                auto_decompress=False,
+            )
+            self._loop = loop
+        return self._session
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        timeout = request.extensions.get("timeout", {})
+        connect_timeout = timeout.get("connect")
+        pool_timeout = timeout.get("pool")
+        body = await request.aread()
+        phase = _RequestPhase(timeout.get("write"))
+        try:
+            session = await self._get_session()
+            response = await session.request(
+                request.method,
+                str(request.url),
+                headers=request.headers.multi_items(),
+                # Content-Length 헤더가 함께 가므로 청크로 나눠도 chunked 인코딩으로 바뀌지 않음
+                data=_iter_body(body, phase) if body else None,
+                allow_redirects=False,
+                trace_request_ctx=phase,
+                timeout=aiohttp.ClientTimeout(
+                    # aiohttp의 connect는 풀에서 연결을 기다리는 시간 + 연결 생성 시간
+                    connect=pool_timeout + connect_timeout if pool_timeout is not None and connect_timeout is not None else None,
+                    sock_connect=connect_timeout,
+                    # aiohttp는 본문을 다 보낸 뒤부터 읽기 타임아웃을 잼 - 본문 전송은 _RequestPhase가 제한
+                    sock_read=timeout.get("read"),
+                ),
+            )
+        except asyncio.CancelledError:
+            if not phase.write_timed_out:
+                raise
+            raise phase.write_timeout_error(request) from None
+        except asyncio.TimeoutError as e:
+            raise phase.timeout_error(str(e), request) from e
+        except aiohttp.ClientConnectorError as e:
+            raise httpx.ConnectError(str(e), request=request) from e
+        except aiohttp.ClientError as e:
+            # 서버가 연결을 끊은 경우 등 - SDK가 연결 오류로 보고 재시도
+            raise httpx.RemoteProtocolError(str(e), request=request) from e
+        finally:
+            phase.finish()
+
+        return httpx.Response(
+            status_code=response.status,
+            headers=response.raw_headers,
+            stream=_AiohttpResponseStream(response),
+            extensions={"http_version": b"HTTP/1.1"},
+        )
+
+    @staticmethod
+    async def _close_stale_session(session: aiohttp.ClientSession):
+        try:
+            await session.close()
+        except Exception:
+            # 원래 루프가 이미 닫혀 소켓 정리가 실패해도 세션은 닫힌 것으로 처리
+            pass
+
+    async def aclose(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
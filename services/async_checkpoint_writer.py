@@ -0,0 +1,153 @@
+# app/services/async_checkpoint_writer.py
+import atexit
+import json
+import os
+import queue
+import threading
+import weakref
+from typing import Dict, IO, Optional
+
+try:
+    import orjson  # C 구현 JSON 직렬화
+    _loads = orjson.loads
+    def _dumps(data, indent: bool = False) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+except ImportError:
+    _loads = json.loads
+    def _dumps(data, indent: bool = False) -> bytes:
+        return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+try:
+    import zstandard  # 설치되어 있으면 체크포인트를 zstd로 압축 저장
+    CHECKPOINT_SUFFIX = ".json.zst"
+except ImportError:
+    zstandard = None
+    CHECKPOINT_SUFFIX = ".json"
+
+def read_checkpoint(path: str) -> Dict:
+    """체크포인트 파일 읽기 (.zst면 압축 해제 후 파싱)"""
+    with open(path, 'rb') as f:
+        blob = f.read()
+    if path.endswith(".zst"):
+        # 압축 해제기는 스레드 간 공유하지 않음 (목록 조회가 스레드 풀에서 병렬로 읽음)
+        blob = zstandard.ZstdDecompressor().decompress(blob)
+    return _loads(blob)
+
+# 종료 시 남은 저장 요청을 마무리하기 위해 생성된 작성기 추적
+_writers = weakref.WeakSet()
+
+class AsyncCheckpointWriter:
+    """체크포인트 파일을 백그라운드 스레드에서 저장 (이벤트 루프가 디스크 I/O를 기다리지 않도록)"""
+
+    def __init__(self, idle_timeout: float = 30.0):
+        self._queue: "queue.Queue" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._idle_timeout = idle_timeout
+        # 작성 스레드에서만 사용하는 열린 저널 파일 핸들
+        self._journals: Dict[str, IO] = {}
+        # 압축기는 작성 스레드에서만 사용
+        self._compressor = zstandard.ZstdCompressor(level=3) if zstandard else None
+        _writers.add(self)
+
+    def enqueue(self, path: str, data: Dict):
+        """저장 요청 추가 - 호출 시점의 내용으로 직렬화하므로 이후 원본을 수정해도 안전"""
+        if path.endswith(".zst"):
+            # 압축 파일은 사람이 직접 읽지 않으므로 들여쓰기 생략 (압축은 작성 스레드에서)
+            self._put(("replace", path, _dumps(data)))
+        else:
+            self._put(("replace", path, _dumps(data, indent=True)))
+
+    def append_line(self, path: str, data: Dict):
+        """JSONL 저널 파일에 한 줄 추가 요청"""
+        payload = _dumps(data) + b"\n"
+        self._put(("append", path, payload))
+
+    def remove(self, path: str):
+        """파일 삭제 요청 (앞선 요청들이 처리된 뒤 삭제)"""
+        self._put(("remove", path, None))
+
+    def _put(self, op: tuple):
+        self._queue.put(op)
+        self._ensure_worker()
+
+    def flush(self):
+        """대기 중인 저장 요청이 모두 디스크에 기록될 때까지 대기"""
+        self._queue.join()
+
+    def _ensure_worker(self):
+        """작성 스레드가 없으면 시작"""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="checkpoint-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            try:
+                op, path, payload = self._queue.get(timeout=self._idle_timeout)
+            except queue.Empty:
+                # 한동안 요청이 없으면 스레드 종료 (다음 enqueue 때 다시 시작)
+                with self._lock:
+                    if self._queue.empty():
+                        self._close_journals()
+                        self._thread = None
+                        return
+                continue
+            try:
+                if op == "replace":
+                    self._write(path, payload)
+                elif op == "append":
+                    self._append(path, payload)
+                else:
+                    self._remove(path)
+            finally:
+                self._queue.task_done()
+
+    def _write(self, path: str, payload: bytes):
+        """임시 파일에 쓴 뒤 교체 (쓰는 도중 중단되어도 이전 체크포인트 유지)"""
+        tmp_path = f"{path}.tmp"
+        try:
+            if path.endswith(".zst"):
+                payload = self._compressor.compress(payload)
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+                # 교체 전에 내용이 디스크에 기록되도록 보장 (체크포인트당 fsync 1회)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"⚠️  Failed to save checkpoint: {e}")
+
+    def _append(self, path: str, payload: bytes):
+        """저널 파일에 한 줄 추가 (파일은 한 번 열어 두고 재사용)"""
+        try:
+            f = self._journals.get(path)
+            if f is None:
+                f = self._journals[path] = open(path, 'ab')
+            f.write(payload)
+            f.flush()
+        except Exception as e:
+            print(f"⚠️  Failed to append checkpoint journal: {e}")
+
+    def _remove(self, path: str):
+        """파일 삭제 (열려 있는 저널이면 먼저 닫음)"""
+        f = self._journals.pop(path, None)
+        if f is not None:
+            f.close()
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"⚠️  Failed to remove {os.path.basename(path)}: {e}")
+
+    def _close_journals(self):
+        for f in self._journals.values():
+            f.close()
+        self._journals.clear()
+
+@atexit.register
+def _flush_all():
+    for writer in list(_writers):
+        writer.flush()
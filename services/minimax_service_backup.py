@@ -1,12 +1,174 @@
 # app/services/minimax_service.py
 import aiohttp
+import aiofiles
+from multidict import CIMultiDict
 import asyncio
-from typing import List, Dict
+from typing import List, Dict, Optional
 import os
 import base64
+import binascii
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 import json
+import logging
+import mmap
+import random
+import secrets
+import shutil
+import subprocess
 from datetime import datetime
+from functools import lru_cache
 import time
+import weakref
+
+from .async_checkpoint_writer import AsyncCheckpointWriter, CHECKPOINT_SUFFIX, read_checkpoint
+from .rate_limiter import AsyncLimiter
+
+try:
+    import pybase64  # SIMD(AVX2/NEON) base64 구현
+    _b64encode = pybase64.b64encode
+except ImportError:
+    # pybase64 미설치 시 base64 모듈 래퍼를 거치지 않고 binascii C 인코더 직접 사용
+    def _b64encode(data) -> bytes:
+        return binascii.b2a_base64(data, newline=False)
+
+try:
+    import orjson  # C 구현 JSON 직렬화/파싱
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+    _json_loads = json.loads
+
+# 다운로드한 영상 검증용 (설치되어 있지 않으면 검증 생략)
+_FFPROBE = shutil.which("ffprobe")
+
+def _probe_video(video_path: str) -> bool:
+    """ffprobe로 영상 길이를 읽어 재생 가능한 파일인지 확인 (잘린/손상된 MP4 감지)"""
+    try:
+        result = subprocess.run(
+            [_FFPROBE, "-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0", video_path],
+            capture_output=True,
+            timeout=10
+        )
+    except subprocess.TimeoutExpired:
+        return False
+    return result.returncode == 0 and bool(result.stdout.strip())
+
+logger = logging.getLogger(__name__)
+
+# 이미지 프롬프트에 덧붙이는 실사 스타일 키워드 + 3분할 방지 키워드
+_REALISTIC_KEYWORDS = ", ultra-realistic photograph, DSLR camera quality, sharp focus, natural textures, professional studio lighting, photojournalism style, documentary photography, high resolution, detailed fur texture, Canon EOS R5, 85mm lens, natural window lighting, NOT cartoon, NOT anime, NOT illustration, NOT drawing, NOT artistic rendering"
+_ANTI_SPLIT_KEYWORDS = ", single scene, single image, unified composition, continuous scene, single moment in time, ONE scene only, NOT split screen, NOT multiple panels, NOT grid, NOT collage, NOT triptych, NOT diptych, NOT multiple views, NOT before and after, NOT step by step visual, NOT comparison, NOT showcase format, NOT presentation layout, NOT display montage, NO panels, NO divisions, NO separations"
+_STYLE_SUFFIX = _REALISTIC_KEYWORDS + _ANTI_SPLIT_KEYWORDS
+
+# 체크포인트 저널 항목 종류별 (완료 인덱스 목록 키, 결과 경로 목록 키)
+_JOURNAL_KEYS = {
+    'image': ('completed_images', 'generated_images'),
+    'video': ('completed_videos', 'video_paths'),
+}
+
+# 배치 시작 안내 출력용 종류별 (결과 단위, 입력 단위, 저장 폴더)
+_BATCH_LOG_INFO = {
+    'image': ('images', 'prompts', 'downloads/minimax_images'),
+    'video': ('videos', 'images', 'downloads/videos'),
+}
+
+# 작업 상태 문자열 (대문자로 변환 후 비교)
+_DONE_STATUSES = frozenset({'FINISHED', 'COMPLETED', 'SUCCESS'})
+_FAILED_STATUSES = frozenset({'FAILED', 'ERROR'})
+
+# 비디오 실행 동안 재사용하는 요청별 타임아웃 (ClientTimeout은 불변이라 공유 가능)
+_VIDEO_POST_TIMEOUT = aiohttp.ClientTimeout(total=600)
+# 단일 영상 생성 요청 (수 MB 이미지 업로드 포함) - 공유 세션에는 전체 타임아웃이 없으므로 요청마다 지정
+_SINGLE_VIDEO_POST_TIMEOUT = aiohttp.ClientTimeout(total=300)
+_FILE_URL_TIMEOUT = aiohttp.ClientTimeout(total=30)
+_VIDEO_DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=1200)
+
+# 비디오 작업 상태 문자열 (소문자로 변환 후 비교)
+_VIDEO_DONE_STATUSES = frozenset({"finished", "success", "completed", "done"})
+_VIDEO_FAILED_STATUSES = frozenset({"failed", "error", "fail"})
+_VIDEO_PROGRESS_STATUSES = frozenset({"processing", "pending", "queued", "running", "preparing", "queueing"})
+
+# 응답 JSON에서 값을 찾을 키 경로 (응답 형식이 제각각이라 앞에서부터 순서대로 확인)
+_TASK_ID_PATHS = (("task_id",), ("data", "task_id"))
+_STATUS_PATHS = (("status",), ("data", "status"), ("task_status",))
+_PROGRESS_PATHS = (("progress",), ("data", "progress"))
+# 완료된 작업의 file_id (일부 응답은 직접 URL을 반환)
+_FILE_ID_PATHS = (("file_id",), ("data", "file_id"), ("data", "video", "file_id"), ("data", "video", "url"), ("data", "url"))
+_DOWNLOAD_URL_PATHS = (
+    # 가장 일반적인 경로들
+    ("file", "download_url"),
+    ("download_url",),
+    ("url",),
+    ("data", "download_url"),
+    ("data", "url"),
+    ("data", "file", "download_url"),
+    ("data", "file", "url"),
+    ("file", "url"),
+    # 비디오 관련 경로들
+    ("video", "download_url"),
+    ("video", "url"),
+    ("data", "video", "download_url"),
+    ("data", "video", "url"),
+    # 파일 관련 경로들
+    ("file_url",),
+    ("data", "file_url"),
+    # 추가 가능한 경로들
+    ("files", "download_url"),
+    ("files", "url"),
+)
+
+def _dig(data, *paths):
+    """키 경로들을 순서대로 따라가 처음 찾은 값 반환 (없으면 None)"""
+    for path in paths:
+        current = data
+        for key in path:
+            if not isinstance(current, dict) or key not in current:
+                break
+            current = current[key]
+        else:
+            return current
+    return None
+
+# 저널이 이 항목 수만큼 쌓이면 전체 체크포인트로 합쳐 저장 (재개 시 읽을 저널 길이 제한)
+_JOURNAL_COMPACT_EVERY = 50
+
+# 일시적 오류로 보고 재시도할 HTTP 상태 코드
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# 이미지 확장자별 MIME 타입 (목록에 없으면 image/jpeg)
+_MIME = {
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.webp': 'image/webp',
+}
+
+@lru_cache(maxsize=16)
+def _encode_image_data_url(image_path: str, mime_type: str, mtime_ns: int, size: int) -> str:
+    """이미지 파일을 base64 Data URL 문자열로 변환 - 재시도/재개 시 같은 파일은 다시 인코딩하지 않도록 캐시
+
+    mtime_ns/size는 캐시 키로만 사용 (파일이 바뀌면 다시 인코딩)
+    """
+    buf = bytearray(b"data:" + mime_type.encode("ascii") + b";base64,")
+    with open(image_path, "rb") as image_file:
+        # 빈 파일은 mmap 불가
+        if os.fstat(image_file.fileno()).st_size == 0:
+            return buf.decode("ascii")
+        # 파일을 bytes로 복사하지 않고 매핑된 페이지에서 바로 인코딩
+        with mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            buf += _b64encode(mm)
+    return buf.decode("ascii")
+
+# 공유 세션을 가질 수 있는 서비스 인스턴스 - 앱 종료 시 close_sessions()로 한 번에 정리
+_INSTANCES: "weakref.WeakSet[MinimaxService]" = weakref.WeakSet()
+
+async def close_sessions():
+    """모든 MinimaxService 인스턴스의 공유 aiohttp 세션 종료 (앱 종료 시 호출)"""
+    for service in list(_INSTANCES):
+        await service.aclose()
 
 class MinimaxService:
     def __init__(self):
@@ -20,10 +182,23 @@ class MinimaxService:
             print("WARNING: MINIMAX_GROUP_ID not set in environment variables - required for file retrieval")
             
         self.base_url = "https://api.minimaxi.chat/v1"
+        # 호출마다 다시 만들지 않도록 엔드포인트 URL과 비디오 기본 파라미터는 한 번만 구성
+        self._gen_url = f"{self.base_url}/video_generation"
+        self._query_url = f"{self.base_url}/query/video_generation"
+        self._retrieve_url = f"{self.base_url}/files/retrieve"
+        # I2V 모델 선택 - I2V-01: 표준 모델, I2V-01-live: 더 빠른 처리 (빠른 처리를 위해 live 버전 사용)
+        self._video_model = "I2V-01-live"
+        self._default_params = {
+            "prompt_optimizer": False,  # 빠른 처리를 위해 비활성화
+            "motion_strength": 0.3,  # 움직임 강도 증가 (0.1 -> 0.3) - 6초 동안 더 많은 동작
+            "video_length": 6  # 비디오 길이 6초로 변경
+        }
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
+        # 요청마다 헤더를 다시 정규화하지 않도록 대소문자 무시 멀티딕트로 한 번만 구성
+        self._req_headers = CIMultiDict(self.headers)
         self.image_dir = os.path.abspath("downloads/minimax_images")
         self.video_dir = os.path.abspath("downloads/videos")
         self.checkpoint_dir = os.path.abspath("downloads/checkpoints")
@@ -31,28 +206,115 @@ class MinimaxService:
         os.makedirs(self.video_dir, exist_ok=True)
         os.makedirs(self.checkpoint_dir, exist_ok=True)
         
+        # 체크포인트는 백그라운드 스레드에서 저장
+        self._checkpoint_writer = AsyncCheckpointWriter()
+        
+        # Minimax API 호출 속도 제한 (고정 sleep 대신 토큰 버킷 + 동시 요청 수 제한)
+        self._image_limiter = AsyncLimiter(max_rate=30, time_period=60)
+        self._image_sem = asyncio.Semaphore(3)
+        self._video_limiter = AsyncLimiter(max_rate=10, time_period=60)
+        # 비디오 상태 조회는 동시 작업 수만큼 늘어나므로 별도 한도로 제한 (초당 2회)
+        self._video_query_limiter = AsyncLimiter(max_rate=120, time_period=60)
+        
+        # 인스턴스 공유 HTTP 세션 (처음 사용할 때 생성, aclose()로 종료)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._session_users = 0  # 공유 세션을 사용 중인 호출 수 (async with 블록 + 진행 중인 생성 작업)
+        self._close_when_idle = False  # async with가 만든 세션이면 마지막 사용자가 끝날 때 종료
+        _INSTANCES.add(self)
+        
+        # 세션별 체크포인트/저널 경로와 체크포인트 목록 캐시 (목록은 디렉터리 mtime + 저널 상태 기준)
+        self._checkpoint_paths: Dict[str, str] = {}
+        self._journal_paths: Dict[str, str] = {}
+        self._checkpoint_list_cache: Optional[tuple] = None
+        # 마지막 전체 저장 이후 세션별 저널 항목 수
+        self._journal_counts: Dict[str, int] = {}
+        
+        # 미리 시작한 다음 이미지 인코딩 작업 (이미지 경로 -> Data URL 작업)
+        self._prefetch_tasks: Dict[str, asyncio.Task] = {}
+        
     def _get_checkpoint_path(self, session_id: str) -> str:
         """체크포인트 파일 경로 반환"""
-        return os.path.join(self.checkpoint_dir, f"checkpoint_{session_id}.json")
+        path = self._checkpoint_paths.get(session_id)
+        if path is None:
+            path = self._checkpoint_paths[session_id] = os.path.join(self.checkpoint_dir, f"checkpoint_{session_id}{CHECKPOINT_SUFFIX}")
+        return path
+    
+    def _get_journal_path(self, session_id: str) -> str:
+        """체크포인트 저널(JSONL) 파일 경로 반환"""
+        path = self._journal_paths.get(session_id)
+        if path is None:
+            path = self._journal_paths[session_id] = os.path.join(self.checkpoint_dir, f"checkpoint_{session_id}.journal")
+        return path
     
     def _save_checkpoint(self, session_id: str, checkpoint_data: Dict):
-        """진행 상황을 체크포인트 파일에 저장"""
+        """진행 상황을 체크포인트 파일에 저장 (실제 파일 쓰기는 백그라운드 스레드에서 수행)"""
         checkpoint_path = self._get_checkpoint_path(session_id)
+        self._checkpoint_list_cache = None
         try:
-            with open(checkpoint_path, 'w', encoding='utf-8') as f:
-                json.dump(checkpoint_data, f, indent=2, ensure_ascii=False)
+            self._checkpoint_writer.enqueue(checkpoint_path, checkpoint_data)
+            # 전체 체크포인트에 반영되었으므로 저널 정리
+            self._checkpoint_writer.remove(self._get_journal_path(session_id))
+            self._journal_counts.pop(session_id, None)
             print(f"💾 Checkpoint saved: {os.path.basename(checkpoint_path)}")
         except Exception as e:
             print(f"⚠️  Failed to save checkpoint: {e}")
     
+    def _journal_completed(self, session_id: str, kind: str, index: int, path) -> bool:
+        """완료된 항목 하나를 저널에 추가 - 전체 체크포인트로 합칠 때가 되면 True"""
+        self._checkpoint_writer.append_line(
+            self._get_journal_path(session_id),
+            {'kind': kind, 'idx': index, 'path': path, 'ts': time.time()}
+        )
+        count = self._journal_counts.get(session_id, 0) + 1
+        self._journal_counts[session_id] = count
+        return count >= _JOURNAL_COMPACT_EVERY
+    
+    def _replay_journal(self, session_id: str, data: Dict) -> bool:
+        """저장된 체크포인트 위에 저널 항목 반영 - 저널이 있었으면 True"""
+        journal_path = self._get_journal_path(session_id)
+        if not os.path.exists(journal_path):
+            return False
+        # 이미 반영된 인덱스는 종류별 set으로 확인 (리스트 탐색 반복으로 O(N²)이 되지 않도록)
+        seen = {}
+        with open(journal_path, 'rb') as f:
+            for line in f:
+                try:
+                    entry = _json_loads(line)
+                except json.JSONDecodeError:
+                    break  # 쓰는 도중 중단된 마지막 줄
+                done_key, paths_key = _JOURNAL_KEYS[entry['kind']]
+                completed = data.setdefault(done_key, [])
+                done = seen.get(done_key)
+                if done is None:
+                    done = seen[done_key] = set(completed)
+                if entry['idx'] in done:
+                    continue
+                done.add(entry['idx'])
+                completed.append(entry['idx'])
+                data.setdefault(paths_key, []).append(entry['path'])
+                data['last_completed_index'] = entry['idx']
+                data['last_update'] = entry['ts']
+        return True
+    
     def _load_checkpoint(self, session_id: str) -> Dict:
         """체크포인트 파일에서 진행 상황 로드"""
+        self._checkpoint_writer.flush()  # 대기 중인 저장이 있으면 먼저 반영
         checkpoint_path = self._get_checkpoint_path(session_id)
+        # 압축 저장 이전에 만들어진 .json 체크포인트도 읽음 (읽은 뒤 새 형식으로 옮김)
+        legacy_path = os.path.join(self.checkpoint_dir, f"checkpoint_{session_id}.json")
+        migrate = legacy_path != checkpoint_path and not os.path.exists(checkpoint_path) and os.path.exists(legacy_path)
+        if migrate:
+            checkpoint_path = legacy_path
         if os.path.exists(checkpoint_path):
             try:
-                with open(checkpoint_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = read_checkpoint(checkpoint_path)
                 print(f"📂 Checkpoint loaded: {os.path.basename(checkpoint_path)}")
+                if self._replay_journal(session_id, data) or migrate:
+                    # 저널을 반영한 전체 체크포인트로 다시 저장 (잘린 줄 뒤에 새 항목이 붙지 않도록)
+                    self._save_checkpoint(session_id, data)
+                if migrate:
+                    self._checkpoint_writer.remove(legacy_path)
                 return data
             except Exception as e:
                 print(f"⚠️  Failed to load checkpoint: {e}")
@@ -60,8 +322,17 @@ class MinimaxService:
     
     def _clear_checkpoint(self, session_id: str):
         """완료 후 체크포인트 파일 삭제"""
+        self._checkpoint_writer.flush()  # 삭제 후 대기 중이던 저장이 파일을 되살리지 않도록
         checkpoint_path = self._get_checkpoint_path(session_id)
+        self._checkpoint_list_cache = None
+        self._journal_counts.pop(session_id, None)
         try:
+            journal_path = self._get_journal_path(session_id)
+            if os.path.exists(journal_path):
+                os.remove(journal_path)
+            legacy_path = os.path.join(self.checkpoint_dir, f"checkpoint_{session_id}.json")
+            if legacy_path != checkpoint_path and os.path.exists(legacy_path):
+                os.remove(legacy_path)
             if os.path.exists(checkpoint_path):
                 os.remove(checkpoint_path)
                 print(f"🗑️  Checkpoint cleared: {os.path.basename(checkpoint_path)}")
@@ -69,9 +340,34 @@ class MinimaxService:
             print(f"⚠️  Failed to clear checkpoint: {e}")
     
     def _create_session_id(self) -> str:
-        """고유한 세션 ID 생성"""
-        return datetime.now().strftime("%Y%m%d_%H%M%S")
-    
+        """고유한 세션 ID 생성 (같은 초에 시작한 세션끼리 체크포인트가 겹치지 않도록 난수 접미사 추가)"""
+        return f"{datetime.now():%Y%m%d_%H%M%S}_{secrets.token_hex(3)}"
+
+    def _log_batch_header(self, mode: str, n: int, batch: int, session_id: str, note: str = None, batch_line: str = None):
+        """배치 생성 시작 안내 출력 - 배치 크기는 실제 루프에서 쓰는 값을 받아 표시 (batch_line으로 동시 처리 문구 대체)"""
+        unit, inputs, save_dir = _BATCH_LOG_INFO[mode]
+        batch_line = batch_line or f"Processing up to {batch} {unit} at a time"
+        logger.info(
+            f"\n{'='*60}\n"
+            f"Starting BATCH {mode} generation for {n} {inputs}\n"
+            f"Session ID: {session_id}\n"
+            f"📁 {unit.capitalize()} will be saved to: {save_dir}/{session_id}/\n"
+            f"{batch_line}" + (f" ({note})" if note else "") + "\n"
+            f"⚠️  Process will STOP on first failure\n"
+            f"🔄 Resume from checkpoint if available\n"
+            f"{'='*60}"
+        )
+
+    @staticmethod
+    def _prompts_digest(prompts: List[str]) -> str:
+        """프롬프트 목록의 해시 (재개 시 같은 목록인지 비교용)"""
+        return hashlib.blake2b(b'\0'.join(p.encode('utf-8') for p in prompts), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _order_by_index(indices: List[int], results: List) -> List:
+        """완료 순서로 저장된 결과를 인덱스 순서로 재정렬"""
+        return [result for _, result in sorted(zip(indices, results), key=lambda pair: pair[0])]
+
     def _get_organized_path(self, base_dir: str, session_id: str, filename: str, project_name: str = None) -> str:
         """세션 ID와 프로젝트 이름으로 정리된 파일 경로 생성"""
         if project_name and session_id:
@@ -90,36 +386,64 @@ class MinimaxService:
         os.makedirs(organized_dir, exist_ok=True)
         return os.path.join(organized_dir, filename)
     
+    def _read_checkpoint_info(self, filename: str) -> Optional[Dict]:
+        """체크포인트 파일 하나를 읽어 요약 정보 반환 (읽기 실패 시 None)"""
+        checkpoint_path = os.path.join(self.checkpoint_dir, filename)
+        try:
+            data = read_checkpoint(checkpoint_path)
+            
+            session_id = filename[len("checkpoint_"):].split(".json", 1)[0]
+            # 마지막 전체 저장 이후 완료 항목은 저널에만 있으므로 메모리에서 반영 (파일은 다시 쓰지 않음)
+            self._replay_journal(session_id, data)
+            return {
+                'session_id': session_id,
+                'phase': data.get('phase', 'unknown'),
+                'completed': data.get('completed', False),
+                'total_prompts': data.get('total_prompts', 0),
+                'total_images': data.get('total_images', 0),
+                'completed_images': len(data.get('completed_images', [])),
+                'completed_videos': len(data.get('completed_videos', [])),
+                'last_update': data.get('last_update'),
+                'failed_at': data.get('failed_at'),
+                'start_time': data.get('start_time')
+            }
+        except Exception as e:
+            print(f"⚠️  Error reading checkpoint {filename}: {e}")
+            return None
+    
     def list_checkpoints(self) -> List[Dict]:
-        """저장된 체크포인트 목록 반환"""
+        """저장된 체크포인트 목록 반환 (파일 읽기는 스레드 풀에서 병렬 처리)"""
+        self._checkpoint_writer.flush()
         checkpoints = []
         try:
-            for filename in os.listdir(self.checkpoint_dir):
-                if filename.startswith("checkpoint_") and filename.endswith(".json"):
-                    checkpoint_path = os.path.join(self.checkpoint_dir, filename)
-                    try:
-                        with open(checkpoint_path, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                        
-                        session_id = filename.replace("checkpoint_", "").replace(".json", "")
-                        checkpoint_info = {
-                            'session_id': session_id,
-                            'phase': data.get('phase', 'unknown'),
-                            'completed': data.get('completed', False),
-                            'total_prompts': data.get('total_prompts', 0),
-                            'total_images': data.get('total_images', 0),
-                            'completed_images': len(data.get('completed_images', [])),
-                            'completed_videos': len(data.get('completed_videos', [])),
-                            'last_update': data.get('last_update'),
-                            'failed_at': data.get('failed_at'),
-                            'start_time': data.get('start_time')
-                        }
-                        checkpoints.append(checkpoint_info)
-                    except Exception as e:
-                        print(f"⚠️  Error reading checkpoint {filename}: {e}")
+            dir_mtime = os.stat(self.checkpoint_dir).st_mtime_ns
+            filenames = []
+            journal_state = []
+            with os.scandir(self.checkpoint_dir) as entries:
+                for entry in entries:
+                    if not entry.name.startswith("checkpoint_"):
+                        continue
+                    if entry.name.endswith((".json", ".json.zst")):
+                        filenames.append(entry.name)
+                    elif entry.name.endswith(".journal"):
+                        stat = entry.stat()
+                        journal_state.append((entry.name, stat.st_mtime_ns, stat.st_size))
+            
+            # 디렉터리와 저널이 바뀌지 않았으면 이전 결과 재사용
+            # (파일 저장은 os.replace라 디렉터리 mtime이 갱신되지만 저널 추가는 갱신되지 않으므로 저널 상태도 키에 포함)
+            cache_key = (dir_mtime, frozenset(journal_state))
+            cached = self._checkpoint_list_cache
+            if cached is not None and cached[0] == cache_key:
+                return list(cached[1])
+            
+            if filenames:
+                with ThreadPoolExecutor(max_workers=min(8, len(filenames))) as executor:
+                    checkpoints = [info for info in executor.map(self._read_checkpoint_info, filenames) if info]
             
             # 최신 순으로 정렬
-            checkpoints.sort(key=lambda x: x.get('last_update', 0), reverse=True)
+            checkpoints.sort(key=lambda x: x.get('last_update') or 0, reverse=True)
+            self._checkpoint_list_cache = (cache_key, checkpoints)
+            checkpoints = list(checkpoints)
             
         except Exception as e:
             print(f"⚠️  Error listing checkpoints: {e}")
@@ -183,8 +507,8 @@ class MinimaxService:
         except Exception as e:
             print(f"⚠️  Error clearing checkpoints: {e}")
         
-    async def generate_images(self, prompts: List[str], session_id: str = None) -> List[str]:
-        """프롬프트 리스트를 받아 이미지 생성 - 체크포인트 지원"""
+    async def generate_images(self, prompts: List[str], session_id: str = None, http_session: aiohttp.ClientSession = None) -> List[str]:
+        """프롬프트 리스트를 받아 이미지 생성 - 체크포인트 지원 (http_session을 주면 그 세션 사용)"""
         if not self.api_key:
             raise RuntimeError("MINIMAX_API_KEY not set in .env file")
             
@@ -192,121 +516,131 @@ class MinimaxService:
         if session_id is None:
             session_id = self._create_session_id()
         
-        # 체크포인트 로드
-        checkpoint = self._load_checkpoint(session_id)
+        # 체크포인트 로드 (대기 중인 저장의 fsync와 파일 읽기가 이벤트 루프를 막지 않도록 스레드에서)
+        checkpoint = await asyncio.to_thread(self._load_checkpoint, session_id)
+        
+        # 같은 프롬프트 목록으로 재개하는지 확인 (체크포인트에는 프롬프트 전체 대신 해시만 저장)
+        prompts_digest = self._prompts_digest(prompts)
+        saved_digest = checkpoint.get('prompts_digest')
+        if saved_digest is not None and saved_digest != prompts_digest:
+            raise RuntimeError(f"Checkpoint {session_id} was created for a different prompt list - use a new session_id")
         
         total_start_time = time.time()
         
-        print(f"\n{'='*60}")
-        print(f"Starting BATCH image generation for {len(prompts)} prompts")
-        print(f"Session ID: {session_id}")
-        print(f"📁 Images will be saved to: downloads/minimax_images/{session_id}/")
-        print(f"Processing 4 images at a time (optimized batch size)")
-        print(f"⚠️  Process will STOP on first failure")
-        print(f"🔄 Resume from checkpoint if available")
-        print(f"{'='*60}")
+        # 4개씩 배치 처리 (더 효율적)
+        batch_size = 4
+        self._log_batch_header('image', len(prompts), batch_size, session_id, "max 3 concurrent API requests")
         
         # 체크포인트에서 이미 완료된 이미지들 확인
         completed_images = checkpoint.get('completed_images', [])
         generated_images = checkpoint.get('generated_images', [])
         
-        # 완료된 개수 확인
-        start_index = len(completed_images)
-        if start_index > 0:
+        # 완료 순서대로 저장되므로 앞에서부터 연속이라는 보장이 없음 - 빠진 인덱스만 다시 처리
+        done = set(completed_images)
+        pending_indices = [i for i in range(len(prompts)) if i not in done]
+        if done:
             print(f"\n🔄 RESUMING FROM CHECKPOINT:")
-            print(f"   Already completed: {start_index}/{len(prompts)} images")
-            print(f"   Starting from image {start_index + 1}")
+            print(f"   Already completed: {len(done)}/{len(prompts)} images")
+            print(f"   Starting from image {pending_indices[0] + 1 if pending_indices else len(prompts)}")
         
         # 체크포인트 초기화 (첫 시작인 경우)
         if 'session_id' not in checkpoint:
             checkpoint = {
                 'session_id': session_id,
                 'total_prompts': len(prompts),
-                'prompts': prompts,
-                'completed_images': [],
-                'generated_images': [],
+                'prompts_digest': prompts_digest,
+                'completed_images': completed_images,
+                'generated_images': generated_images,
                 'start_time': total_start_time,
                 'phase': 'image_generation',
                 'session_image_dir': os.path.join(self.image_dir, session_id),
                 'session_video_dir': os.path.join(self.video_dir, session_id)
             }
             self._save_checkpoint(session_id, checkpoint)
+        elif saved_digest is None:
+            # 이전 형식 체크포인트 - 다음 저장부터 프롬프트 전체 대신 해시 저장
+            checkpoint['prompts_digest'] = prompts_digest
+            if checkpoint.get('phase') == 'image_generation':
+                checkpoint.pop('prompts', None)
         
         # 남은 프롬프트들만 처리
-        remaining_prompts = prompts[start_index:]
-        if not remaining_prompts:
+        if not pending_indices:
             print(f"✅ All images already completed!")
-            return generated_images
+            return self._order_by_index(completed_images, generated_images)
         
-        # 4개씩 배치 처리 (더 효율적)
-        batch_size = 4
-        for batch_start in range(0, len(remaining_prompts), batch_size):
-            batch_end = min(batch_start + batch_size, len(remaining_prompts))
-            batch_prompts = remaining_prompts[batch_start:batch_end]
-            
-            actual_start = start_index + batch_start
-            actual_end = start_index + batch_end
+        for batch_start in range(0, len(pending_indices), batch_size):
+            batch_indices = pending_indices[batch_start:batch_start + batch_size]
             
-            print(f"\n🔄 Processing batch {batch_start//batch_size + 1}/{(len(remaining_prompts) + batch_size - 1)//batch_size}")
-            print(f"   Images {actual_start + 1}-{actual_end}")
+            print(f"\n🔄 Processing batch {batch_start//batch_size + 1}/{(len(pending_indices) + batch_size - 1)//batch_size}")
+            print(f"   Images {', '.join(str(i + 1) for i in batch_indices)}")
             
-            # 배치 실행
-            batch_results = []  # 초기화 추가
+            failures = []  # (인덱스, 오류) - 배치 안에서 실패한 이미지
             
-            async def generate_single_image(index: int, prompt: str):
-                real_index = actual_start + index
+            async def generate_single_image(real_index: int):
                 print(f"[Image {real_index+1}/{len(prompts)}] 🚀 Starting generation...")
                 
-                async with aiohttp.ClientSession() as session:
-                    try:
-                        image_path = await self._generate_single_image(session, prompt, real_index, session_id)
-                        if image_path:
-                            print(f"[Image {real_index+1}/{len(prompts)}] ✓ Successfully completed")
-                            return image_path
-                        else:
-                            # 실패 시 예외 발생
-                            error_msg = f"Failed to generate image {real_index+1}"
-                            print(f"[Image {real_index+1}/{len(prompts)}] ❌ {error_msg}")
-                            raise RuntimeError(error_msg)
-                    except Exception as e:
-                        error_msg = f"Error generating image {real_index+1}: {e}"
+                # 매 이미지마다 세션을 만들지 않고 공유 세션으로 연결(TLS) 재사용
+                session = http_session or await self._acquire_session()
+                try:
+                    image_path = await self._generate_single_image(session, prompts[real_index], real_index, session_id)
+                    if image_path:
+                        print(f"[Image {real_index+1}/{len(prompts)}] ✓ Successfully completed")
+                        return real_index, image_path
+                    else:
+                        # 실패 시 예외 발생
+                        error_msg = f"Failed to generate image {real_index+1}"
                         print(f"[Image {real_index+1}/{len(prompts)}] ❌ {error_msg}")
                         raise RuntimeError(error_msg)
+                except Exception as e:
+                    error_msg = f"Error generating image {real_index+1}: {e}"
+                    print(f"[Image {real_index+1}/{len(prompts)}] ❌ {error_msg}")
+                    failures.append((real_index, error_msg))
+                    raise RuntimeError(error_msg)
+                finally:
+                    if http_session is None:
+                        await self._release_session()
             
-            tasks = [generate_single_image(i, prompt) for i, prompt in enumerate(batch_prompts)]
-            batch_results = await asyncio.gather(*tasks)  # return_exceptions=True 제거
+            tasks = [asyncio.create_task(generate_single_image(i)) for i in batch_indices]
+            compact = False
             
+            # 끝나는 순서대로 바로 저널에 기록 (가장 느린 이미지를 기다리는 동안 완료분이 유실되지 않도록)
             try:
-                # 성공한 결과들 추가 및 체크포인트 업데이트
-                for i, result in enumerate(batch_results):
-                    real_index = actual_start + i
-                    # result가 이미지 경로 리스트인 경우 첫 번째를 메인으로 사용, 모든 경로 저장
+                for next_done in asyncio.as_completed(tasks):
+                    try:
+                        real_index, result = await next_done
+                    except Exception:
+                        continue  # 실패는 failures에 기록됨 - 나머지 진행 중인 이미지는 끝까지 받아 저장
+                    # result가 이미지 경로 리스트인 경우 모든 경로 저장
                     if isinstance(result, list) and len(result) > 0:
-                        # 모든 이미지 경로를 저장
-                        generated_images.append(result)  # 전체 리스트 저장
                         print(f"✓ Generated {len(result)} images for prompt {real_index+1}")
-                    else:
-                        # 단일 이미지인 경우
-                        generated_images.append(result)
-                    
+                    generated_images.append(result)
                     completed_images.append(real_index)
-                    
-                    # 각 이미지 완료 후 체크포인트 저장
-                    checkpoint['completed_images'] = completed_images
-                    checkpoint['generated_images'] = generated_images
-                    checkpoint['last_completed_index'] = real_index
-                    checkpoint['last_update'] = time.time()
-                    self._save_checkpoint(session_id, checkpoint)
-                    
-            except Exception as e:
+                    compact = self._journal_completed(session_id, 'image', real_index, result)
+            finally:
+                # 호출 측이 취소된 경우 남은 작업이 백그라운드에서 계속 파일/저널을 쓰지 않도록 정리
+                pending = [task for task in tasks if not task.done()]
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    await asyncio.gather(*pending, return_exceptions=True)
+            
+            # 완료 항목은 저널에만 추가하고 전체 체크포인트는 저널이 충분히 쌓였을 때만 다시 저장
+            checkpoint['completed_images'] = completed_images
+            checkpoint['generated_images'] = generated_images
+            if completed_images:
+                checkpoint['last_completed_index'] = max(completed_images)
+            checkpoint['last_update'] = time.time()
+            
+            if failures:
                 # 실패 시 체크포인트 저장 후 중단
-                failed_index = actual_start + len(batch_results)  # 이제 batch_results가 항상 정의됨
+                failed_index, e = min(failures, key=lambda f: f[0])
                 checkpoint['failed_at'] = {
                     'index': failed_index,
                     'error': str(e),
                     'timestamp': time.time()
                 }
                 self._save_checkpoint(session_id, checkpoint)
+                await asyncio.to_thread(self._checkpoint_writer.flush)
                 
                 print(f"\n{'='*60}")
                 print(f"❌ IMAGE GENERATION FAILED - STOPPING PROCESS")
@@ -317,20 +651,8 @@ class MinimaxService:
                 print(f"{'='*60}")
                 raise RuntimeError(f"Image generation failed: {e}")
             
-            # 배치 간 대기 (API 제한 방지)
-            if actual_end < len(prompts):
-                print(f"⏳ Waiting 5 seconds before next batch...")
-                await asyncio.sleep(5)
-        
-            # 배치 간 대기 (API 제한 방지)
-            if actual_end < len(prompts):
-                print(f"⏳ Waiting 10 seconds before next image...")
-                await asyncio.sleep(10)
-                
-            # 배치 간 대기 (API 제한 방지)
-            if actual_end < len(prompts):
-                print(f"⏳ Waiting 8 seconds before next batch...")
-                await asyncio.sleep(8)
+            if compact:
+                self._save_checkpoint(session_id, checkpoint)
         
         total_time = int(time.time() - total_start_time)
         success_count = len(generated_images)
@@ -340,6 +662,7 @@ class MinimaxService:
         checkpoint['completion_time'] = time.time()
         checkpoint['total_time'] = total_time
         self._save_checkpoint(session_id, checkpoint)
+        await asyncio.to_thread(self._checkpoint_writer.flush)
         
         print(f"\n{'='*60}")
         print(f"✅ ALL IMAGES GENERATED SUCCESSFULLY!")
@@ -348,17 +671,14 @@ class MinimaxService:
         print(f"  Success rate: {success_count}/{len(prompts)}")
         print(f"{'='*60}\n")
                 
-        return generated_images
+        # 완료 순서로 쌓인 결과를 프롬프트 순서로 정렬해 반환
+        return self._order_by_index(completed_images, generated_images)
         
     async def _generate_single_image(self, session: aiohttp.ClientSession, prompt: str, index: int, session_id: str = None) -> str:
         """단일 프롬프트로 이미지 생성"""
         try:
-            # 강화된 실사 스타일 키워드 + 더욱 강력한 3분할 방지 키워드 추가
-            realistic_keywords = ", ultra-realistic photograph, DSLR camera quality, sharp focus, natural textures, professional studio lighting, photojournalism style, documentary photography, high resolution, detailed fur texture, Canon EOS R5, 85mm lens, natural window lighting, NOT cartoon, NOT anime, NOT illustration, NOT drawing, NOT artistic rendering"
-            anti_split_keywords = ", single scene, single image, unified composition, continuous scene, single moment in time, ONE scene only, NOT split screen, NOT multiple panels, NOT grid, NOT collage, NOT triptych, NOT diptych, NOT multiple views, NOT before and after, NOT step by step visual, NOT comparison, NOT showcase format, NOT presentation layout, NOT display montage, NO panels, NO divisions, NO separations"
-            style_enhanced_prompt = f"{prompt[:1000]}{realistic_keywords}{anti_split_keywords}"
-            
-            print(f"\nGenerating image {index+1}/10:")
+            # 강화된 실사 스타일 키워드 + 더욱 강력한 3분할 방지 키워드 추가 (최대 1500자)
+            style_enhanced_prompt = (prompt[:1000] + _STYLE_SUFFIX)[:1500]
             
             # Minimax Image Generation API 엔드포인트
             url = f"{self.base_url}/image_generation"
@@ -366,105 +686,108 @@ class MinimaxService:
             # API 문서에 맞는 올바른 payload 구조
             payload = {
                 "model": "image-01",  # 올바른 이미지 생성 모델
-                "prompt": style_enhanced_prompt[:1500],  # 강화된 실사 키워드 + 3분할 방지 키워드 포함
+                "prompt": style_enhanced_prompt,  # 강화된 실사 키워드 + 3분할 방지 키워드 포함
                 "aspect_ratio": "9:16",  # 기본 9:16, 다른 옵션: "1:1", "4:3", "3:2", "2:3", "3:4", "16:9", "21:9"
                 "response_format": "url",  # URL 형식으로 응답 (24시간 유효)
                 "n": 3,  # 생성할 이미지 수 (1-9) - 3개로 변경하여 클래식 워크플로우 지원
                 "prompt_optimizer": False  # 빠른 처리를 위해 프롬프트 최적화 비활성화 (분할 방지)
             }
             
-            print(f"\nGenerating image {index+1}/10:")
-            print(f"  Prompt preview: {prompt[:80]}...")
-            print(f"  Calling Minimax Image API...")
+            print(
+                f"\nGenerating image {index+1}/10:\n"
+                f"  Prompt preview: {prompt[:80]}...\n"
+                f"  Calling Minimax Image API..."
+            )
             
-            async with session.post(
-                url,
-                json=payload,
-                headers=self.headers,
-                timeout=aiohttp.ClientTimeout(total=150)  # 60초 타임아웃
-            ) as response:
-                response_text = await response.text()
+            # 동시 요청 수 + 분당 요청 수 제한, 429/5xx는 Retry-After/백오프로 재시도
+            async with self._image_sem, self._image_limiter:
+                status, body = await self._request_with_retry(
+                    session, "POST",
+                    url,
+                    data=_json_dumps(payload),
+                    headers=self._req_headers,
+                    timeout=aiohttp.ClientTimeout(total=150)  # 60초 타임아웃
+                )
+            
+            if status != 200:
+                print(f"  API Error: {status}")
+                print(f"  Error details: {body[:300].decode('utf-8', errors='replace')}")
+                if status == 401:
+                    print("  Authentication failed. Please check your MINIMAX_API_KEY")
+                return ""
                 
-                if response.status != 200:
-                    print(f"  API Error: {response.status}")
-                    print(f"  Error details: {response_text[:300]}")
-                    if response.status == 401:
-                        print("  Authentication failed. Please check your MINIMAX_API_KEY")
-                    return ""
-                    
-                try:
-                    result = json.loads(response_text)
-                except json.JSONDecodeError:
-                    print(f"  Failed to parse JSON response")
+            try:
+                result = _json_loads(body)
+            except json.JSONDecodeError:
+                print(f"  Failed to parse JSON response")
+                return ""
+            
+            # base_resp 체크
+            if "base_resp" in result:
+                base_resp = result["base_resp"]
+                if base_resp.get("status_code") != 0:
+                    print(f"  API error: {base_resp.get('status_code')} - {base_resp.get('status_msg')}")
                     return ""
+            
+            # 성공적인 응답 처리
+            if "data" in result:
+                data = result["data"]
                 
-                # base_resp 체크
-                if "base_resp" in result:
-                    base_resp = result["base_resp"]
-                    if base_resp.get("status_code") != 0:
-                        print(f"  API error: {base_resp.get('status_code')} - {base_resp.get('status_msg')}")
-                        return ""
-                
-                # 성공적인 응답 처리
-                if "data" in result:
-                    data = result["data"]
+                # image_urls 필드로 URL이 직접 반환되는 경우 - 4개 이미지 처리
+                if "image_urls" in data and len(data["image_urls"]) > 0:
+                    saved_paths = []
+                    for i, image_url in enumerate(data["image_urls"]):
+                        # index_sub 형식으로 저장: image_1_0.jpg, image_1_1.jpg, etc.
+                        sub_index = f"{index}_{i}" if len(data["image_urls"]) > 1 else str(index)
+                        image_path = await self._download_image(session, image_url, sub_index, session_id)
+                        if image_path:
+                            saved_paths.append(image_path)
                     
-                    # image_urls 필드로 URL이 직접 반환되는 경우 - 4개 이미지 처리
-                    if "image_urls" in data and len(data["image_urls"]) > 0:
-                        saved_paths = []
-                        for i, image_url in enumerate(data["image_urls"]):
-                            # index_sub 형식으로 저장: image_1_0.jpg, image_1_1.jpg, etc.
-                            sub_index = f"{index}_{i}" if len(data["image_urls"]) > 1 else str(index)
-                            image_path = await self._download_image(session, image_url, sub_index, session_id)
+                    # 모든 이미지 경로를 반환 (첫 번째가 메인)
+                    return saved_paths if saved_paths else ""
+                
+                # images 형식으로 반환되는 경우 - 4개 이미지 처리
+                elif "images" in data and len(data["images"]) > 0:
+                    saved_paths = []
+                    for i, image_info in enumerate(data["images"]):
+                        if "url" in image_info:
+                            sub_index = f"{index}_{i}" if len(data["images"]) > 1 else str(index)
+                            image_path = await self._download_image(session, image_info["url"], sub_index, session_id)
                             if image_path:
                                 saved_paths.append(image_path)
-                        
-                        # 모든 이미지 경로를 반환 (첫 번째가 메인)
-                        return saved_paths if saved_paths else ""
-                    
-                    # images 형식으로 반환되는 경우 - 4개 이미지 처리
-                    elif "images" in data and len(data["images"]) > 0:
-                        saved_paths = []
-                        for i, image_info in enumerate(data["images"]):
-                            if "url" in image_info:
-                                sub_index = f"{index}_{i}" if len(data["images"]) > 1 else str(index)
-                                image_path = await self._download_image(session, image_info["url"], sub_index, session_id)
-                                if image_path:
-                                    saved_paths.append(image_path)
-                        return saved_paths if saved_paths else ""
-                
-                print(f"  Unexpected response structure")
-                return ""
-                
+                    return saved_paths if saved_paths else ""
+            
+            print(f"  Unexpected response structure")
+            return ""
+            
         except asyncio.TimeoutError:
             print(f"  Timeout after 60 seconds")
             return ""
         except Exception as e:
-            print(f"  Error generating image: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("  Error generating image: %s", e)
             return ""
             
     async def _wait_for_image_task(self, session: aiohttp.ClientSession, task_id: str, session_id: str, index: int = None) -> str:
-        """이미지 생성 작업 완료 대기"""
-        max_attempts = 120  # 최대 6분 대기 (3초 간격)
+        """이미지 생성 작업 완료 대기 (지수 백오프 + 지터로 폴링)"""
+        max_wait_seconds = 360  # 최대 6분 대기
         attempt = 0
         start_time = time.time()
         
         # 작업 상태 확인 URL - Minimax API에 맞게 수정 필요
         check_url = f"{self.base_url}/query/image_generation"
+        params = {"task_id": task_id}
         
         print(f"  ⏱️  Waiting for image generation task: {task_id}")
         
-        while attempt < max_attempts:
+        while time.time() - start_time < max_wait_seconds:
+            retry_after = None
             try:
-                params = {"task_id": task_id}
-                
                 async with session.get(
                     check_url,
                     params=params,
-                    headers=self.headers
+                    headers=self._req_headers
                 ) as response:
+                    retry_after = response.headers.get("Retry-After")
                     if response.status == 200:
                         result = await response.json()
                         
@@ -479,9 +802,9 @@ class MinimaxService:
                         # 작업 완료 확인
                         if "data" in result:
                             data = result["data"]
-                            status = data.get("status", "")
+                            status = (data.get("status") or "").upper()
                             
-                            if status in ["finished", "completed", "success", "FINISHED", "COMPLETED", "SUCCESS", "Success"]:
+                            if status in _DONE_STATUSES:
                                 elapsed_time = int(time.time() - start_time)
                                 print(f"  ✅ Image generated successfully in {elapsed_time} seconds")
                                 
@@ -507,12 +830,12 @@ class MinimaxService:
                                                 saved_paths.append(image_path)
                                     return saved_paths if saved_paths else ""
                         
-                            elif status in ["failed", "error", "FAILED", "ERROR"]:
+                            elif status in _FAILED_STATUSES:
                                 error_msg = "Image generation failed"
                                 print(f"  ❌ {error_msg}")
                                 raise RuntimeError(error_msg)
                             else:
-                                # 진행 상황을 덜 자주 출력 (15초마다)
+                                # 진행 상황을 덜 자주 출력
                                 if attempt % 5 == 0:
                                     elapsed_time = int(time.time() - start_time)
                                     print(f"  🔄 Still generating... ({elapsed_time}s elapsed)")
@@ -522,12 +845,17 @@ class MinimaxService:
                 raise
             except Exception as e:
                 print(f"  ⚠️  Error checking task status: {e}")
-                
-            await asyncio.sleep(3)  # 3초마다 확인
+            
+            # 1, 2, 4, 8, 8, ... 초 간격 + 지터 (Retry-After가 있으면 우선)
+            if retry_after:
+                delay = self._retry_delay(attempt, retry_after)
+            else:
+                delay = min(8, 1 << min(attempt, 3)) + random.uniform(0, 0.3)
+            await asyncio.sleep(delay)
             attempt += 1
             
         # 타임아웃 발생
-        timeout_msg = f"Image generation timeout after {(max_attempts * 3) // 60} minutes"
+        timeout_msg = f"Image generation timeout after {max_wait_seconds // 60} minutes"
         print(f"  ⏰ {timeout_msg}")
         raise RuntimeError(timeout_msg)
             
@@ -537,7 +865,6 @@ class MinimaxService:
             print(f"  Downloading image from URL...")
             async with session.get(url, timeout=aiohttp.ClientTimeout(total=60)) as response:
                 if response.status == 200:
-                    content = await response.read()
                     # 파일 확장자를 URL이나 헤더에서 추출
                     content_type = response.headers.get('Content-Type', 'image/jpeg')
                     ext = 'jpg'
@@ -549,7 +876,7 @@ class MinimaxService:
                     # 세션 ID별 폴더 생성
                     if session_id:
                         session_image_dir = os.path.join(self.image_dir, session_id)
-                        os.makedirs(session_image_dir, exist_ok=True)
+                        await asyncio.to_thread(os.makedirs, session_image_dir, exist_ok=True)
                         image_filename = f"image_{index}.{ext}"
                         image_path = os.path.join(session_image_dir, image_filename)
                         print(f"  📁 Saving to session folder: {session_id}/")
@@ -557,8 +884,10 @@ class MinimaxService:
                         image_filename = f"image_{index}.{ext}"
                         image_path = os.path.join(self.image_dir, image_filename)
                     
-                    with open(image_path, 'wb') as f:
-                        f.write(content)
+                    # 전체를 메모리에 읽지 않고 받는 대로 파일에 기록
+                    async with aiofiles.open(image_path, 'wb') as f:
+                        async for chunk in response.content.iter_chunked(64 * 1024):
+                            await f.write(chunk)
                     print(f"  ✓ Image saved: {os.path.relpath(image_path, self.image_dir)}")
                     
                     return image_path
@@ -601,157 +930,150 @@ class MinimaxService:
         if not os.path.exists(first_frame_image_path):
             raise FileNotFoundError(f"Image file not found: {first_frame_image_path}")
         
-        print(f"🎬 Generating single video with image...")
-        print(f"📸 Image: {os.path.basename(first_frame_image_path)}")
-        print(f"📝 Prompt: {prompt[:100]}...")
+        logger.info(f"🎬 Generating single video with image...")
+        logger.info(f"📸 Image: {os.path.basename(first_frame_image_path)}")
+        logger.info(f"📝 Prompt: {prompt[:100]}...")
         
+        session = await self._acquire_session()
         try:
-            async with aiohttp.ClientSession() as session:
-                # 이미지를 base64로 인코딩하고 data URL 형식으로 변환
-                with open(first_frame_image_path, "rb") as image_file:
-                    image_base64 = base64.b64encode(image_file.read()).decode('utf-8')
-                
-                # 파일 확장자에 따른 MIME 타입 결정
-                file_extension = os.path.splitext(first_frame_image_path)[1].lower()
-                if file_extension in ['.jpg', '.jpeg']:
-                    mime_type = 'image/jpeg'
-                elif file_extension == '.png':
-                    mime_type = 'image/png'
-                else:
-                    mime_type = 'image/jpeg'  # 기본값
-                
-                # Data URL 형식으로 변환
-                first_frame_image_data_url = f"data:{mime_type};base64,{image_base64}"
+            # 파일 확장자에 따른 MIME 타입 결정
+            mime_type = _MIME.get(os.path.splitext(first_frame_image_path)[1].lower(), "image/jpeg")
+            
+            # 이미지를 base64 Data URL로 변환 (파일 읽기/인코딩은 스레드에서, 캐시 공유)
+            first_frame_image_data_url = await asyncio.to_thread(self._build_image_data_url, first_frame_image_path, mime_type)
+            
+            logger.info(f"📸 Image format: {mime_type}")
+            logger.debug(f"📏 Data URL length: {len(first_frame_image_data_url)} chars")
+            
+            # 영상 생성 요청
+            request_data = {
+                "model": "video-01",
+                "prompt": prompt,
+                "first_frame_image": first_frame_image_data_url  # Data URL 형식으로 전송
+            }
+            
+            logger.info(f"🚀 Sending video generation request...")
+            
+            async with session.post(
+                self._gen_url,
+                headers=self._req_headers,
+                json=request_data,
+                timeout=_SINGLE_VIDEO_POST_TIMEOUT
+            ) as response:
                 
-                print(f"📸 Image format: {mime_type}")
-                print(f"📏 Base64 length: {len(image_base64)} chars")
+                response_text = await response.text()
+                logger.debug(f"📄 Response status: {response.status}")
+                logger.debug(f"📄 Response: {response_text[:300]}...")
                 
-                # 영상 생성 요청
-                request_data = {
-                    "model": "video-01",
-                    "prompt": prompt,
-                    "first_frame_image": first_frame_image_data_url  # Data URL 형식으로 전송
-                }
+                if response.status != 200:
+                    logger.warning(f"❌ Video generation request failed: {response.status}")
+                    logger.warning(f"Error details: {response_text}")
+                    raise Exception(f"Video generation failed: {response.status} - {response_text}")
                 
-                print(f"🚀 Sending video generation request...")
+                try:
+                    result = json.loads(response_text)
+                except json.JSONDecodeError:
+                    logger.warning(f"❌ Failed to parse JSON response")
+                    raise Exception("Invalid JSON response from Minimax")
                 
-                async with session.post(
-                    f"{self.base_url}/video_generation", 
-                    headers=self.headers,
-                    json=request_data
-                ) as response:
-                    
-                    response_text = await response.text()
-                    print(f"📄 Response status: {response.status}")
-                    print(f"📄 Response: {response_text[:300]}...")
-                    
-                    if response.status != 200:
-                        print(f"❌ Video generation request failed: {response.status}")
-                        print(f"Error details: {response_text}")
-                        raise Exception(f"Video generation failed: {response.status} - {response_text}")
-                    
-                    try:
-                        result = json.loads(response_text)
-                    except json.JSONDecodeError:
-                        print(f"❌ Failed to parse JSON response")
-                        raise Exception("Invalid JSON response from Minimax")
-                    
-                    task_id = result.get("task_id")
-                    
-                    if not task_id:
-                        print(f"❌ No task_id in response: {result}")
-                        raise Exception("No task_id received from Minimax")
-                    
-                    print(f"✅ Video generation task started: {task_id}")
+                task_id = result.get("task_id")
                 
-                # 작업 완료 대기
-                print(f"⏳ Waiting for video generation...")
-                video_result = await self._wait_for_video_task(session, task_id)
+                if not task_id:
+                    logger.warning(f"❌ No task_id in response: {result}")
+                    raise Exception("No task_id received from Minimax")
                 
-                if video_result:
-                    # video_result가 URL인지 file_id인지 확인
-                    if video_result.startswith("http"):
-                        # URL인 경우 바로 다운로드
-                        print(f"📥 Direct video URL received")
-                        video_url = video_result
-                    else:
-                        # file_id인 경우 URL로 변환
-                        print(f"📄 File ID received: {video_result}")
-                        print(f"🔗 Converting file_id to download URL...")
-                        video_url = await self._get_file_url(session, video_result)
-                        
-                        if not video_url:
-                            print(f"❌ Failed to get download URL for file_id: {video_result}")
-                            return {
-                                "status": "failed",
-                                "task_id": task_id,
-                                "error": "Failed to get download URL"
-                            }
-                        
-                        print(f"✅ Download URL obtained: {video_url[:100]}...")
-                    
-                    # 영상 다운로드
-                    video_filename = f"{task_name or 'video'}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mp4"
-                    video_path = await self._download_single_video(session, video_url, video_filename)
+                logger.info(f"✅ Video generation task started: {task_id}")
+            
+            # 작업 완료 대기
+            logger.info(f"⏳ Waiting for video generation...")
+            video_result = await self._wait_for_video_task(session, task_id)
+            
+            if video_result:
+                # video_result가 URL인지 file_id인지 확인
+                if video_result.startswith("http"):
+                    # URL인 경우 바로 다운로드
+                    logger.info(f"📥 Direct video URL received")
+                    video_url = video_result
+                else:
+                    # file_id인 경우 URL로 변환
+                    logger.info(f"📄 File ID received: {video_result}")
+                    logger.info(f"🔗 Converting file_id to download URL...")
+                    video_url = await self._get_file_url(session, video_result)
                     
-                    if video_path:
-                        print(f"🎉 Video generated successfully: {os.path.basename(video_path)}")
-                        
-                        return {
-                            "status": "success",
-                            "task_id": task_id,
-                            "file_id": video_result if not video_result.startswith("http") else None,
-                            "video_url": video_url,
-                            "video_path": video_path,
-                            "filename": os.path.basename(video_path)
-                        }
-                    else:
-                        print(f"❌ Video download failed")
+                    if not video_url:
+                        logger.warning(f"❌ Failed to get download URL for file_id: {video_result}")
                         return {
                             "status": "failed",
                             "task_id": task_id,
-                            "error": "Video download failed"
+                            "error": "Failed to get download URL"
                         }
+                    
+                    logger.info(f"✅ Download URL obtained: {video_url[:100]}...")
+                
+                # 영상 다운로드
+                video_filename = f"{task_name or 'video'}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mp4"
+                video_path = await self._download_single_video(session, video_url, video_filename)
+                
+                if video_path:
+                    logger.info(f"🎉 Video generated successfully: {os.path.basename(video_path)}")
+                    
+                    return {
+                        "status": "success",
+                        "task_id": task_id,
+                        "file_id": video_result if not video_result.startswith("http") else None,
+                        "video_url": video_url,
+                        "video_path": video_path,
+                        "filename": os.path.basename(video_path)
+                    }
                 else:
-                    print(f"❌ Video generation failed - no file_id or URL received")
+                    logger.warning(f"❌ Video download failed")
                     return {
                         "status": "failed",
                         "task_id": task_id,
-                        "error": "No file_id or URL received"
+                        "error": "Video download failed"
                     }
-        
+            else:
+                logger.warning(f"❌ Video generation failed - no file_id or URL received")
+                return {
+                    "status": "failed",
+                    "task_id": task_id,
+                    "error": "No file_id or URL received"
+                }
+    
         except Exception as e:
-            print(f"❌ Error in video generation: {e}")
+            logger.warning(f"❌ Error in video generation: {e}")
             return {
                 "status": "failed",
                 "error": str(e)
             }
+        finally:
+            await self._release_session()
 
     async def _download_single_video(self, session: aiohttp.ClientSession, url: str, filename: str) -> str:
         """단일 영상 다운로드"""
         try:
-            print(f"📥 Downloading video: {filename}")
+            logger.info(f"📥 Downloading video: {filename}")
             
             async with session.get(url) as response:
                 if response.status == 200:
                     video_path = os.path.join(self.video_dir, filename)
                     
-                    with open(video_path, 'wb') as f:
-                        async for chunk in response.content.iter_chunked(8192):
-                            f.write(chunk)
+                    async with aiofiles.open(video_path, 'wb') as f:
+                        async for chunk in response.content.iter_chunked(1 << 16):
+                            await f.write(chunk)
                     
-                    print(f"✅ Video downloaded: {video_path}")
+                    logger.info(f"✅ Video downloaded: {video_path}")
                     return video_path
                 else:
-                    print(f"❌ Failed to download video: {response.status}")
+                    logger.warning(f"❌ Failed to download video: {response.status}")
                     raise Exception(f"Failed to download video: {response.status}")
         
         except Exception as e:
-            print(f"❌ Error downloading video: {e}")
+            logger.warning(f"❌ Error downloading video: {e}")
             raise e
 
-    async def create_videos_with_prompts(self, image_paths: List[str], video_prompts: List[str] = None, session_id: str = None) -> List[str]:
-        """이미지와 비디오 프롬프트를 사용하여 비디오 생성 - 체크포인트 지원, 2개씩 병렬 처리"""
+    async def create_videos_with_prompts(self, image_paths: List[str], video_prompts: List[str] = None, session_id: str = None, http_session: aiohttp.ClientSession = None, max_concurrent: int = 4) -> List[str]:
+        """이미지와 비디오 프롬프트를 사용하여 비디오 생성 - 체크포인트 지원, 최대 max_concurrent개 동시 처리"""
         if not self.api_key:
             raise RuntimeError("MINIMAX_API_KEY not set in .env file")
             
@@ -759,31 +1081,28 @@ class MinimaxService:
         if session_id is None:
             session_id = self._create_session_id()
         
-        # 체크포인트 로드
-        checkpoint = self._load_checkpoint(session_id)
+        # 체크포인트 로드 (대기 중인 저장의 fsync와 파일 읽기가 이벤트 루프를 막지 않도록 스레드에서)
+        checkpoint = await asyncio.to_thread(self._load_checkpoint, session_id)
         
         total_start_time = time.time()
         
-        print(f"\n{'='*60}")
-        print(f"Starting BATCH video generation for {len(image_paths)} images")
-        print(f"Session ID: {session_id}")
-        print(f"📁 Videos will be saved to: downloads/videos/{session_id}/")
-        print(f"Processing 2 videos at a time (optimized batch)")
-        print(f"Using model: I2V-01-live (2 seconds each)")
-        print(f"⚠️  Process will STOP on first failure")
-        print(f"🔄 Resume from checkpoint if available")
-        print(f"{'='*60}")
+        # 제출 단계만 max_concurrent개로 제한하고 대기/다운로드는 남은 비디오 모두 동시에 진행
+        self._log_batch_header(
+            'video', len(image_paths), max_concurrent, session_id, "model: I2V-01-live, 2 seconds each",
+            batch_line=f"Submitting up to {max_concurrent} videos at a time (all pending videos are polled and downloaded concurrently)"
+        )
         
         # 체크포인트에서 이미 완료된 비디오들 확인
         completed_videos = checkpoint.get('completed_videos', [])
         video_paths = checkpoint.get('video_paths', [])
         
-        # 완료된 개수 확인
-        start_index = len(completed_videos)
-        if start_index > 0:
-            print(f"\n🔄 RESUMING FROM CHECKPOINT:")
-            print(f"   Already completed: {start_index}/{len(image_paths)} videos")
-            print(f"   Starting from video {start_index + 1}")
+        # 완료 순서대로 저장되므로 빠진 인덱스만 다시 처리
+        done = set(completed_videos)
+        pending_indices = [i for i in range(len(image_paths)) if i not in done]
+        if done:
+            logger.info(f"\n🔄 RESUMING FROM CHECKPOINT:")
+            logger.info(f"   Already completed: {len(done)}/{len(image_paths)} videos")
+            logger.info(f"   Starting from video {pending_indices[0] + 1 if pending_indices else len(image_paths)}")
         
         # 체크포인트 초기화 또는 비디오 단계로 업데이트
         if 'session_id' not in checkpoint:
@@ -792,8 +1111,6 @@ class MinimaxService:
                 'total_images': len(image_paths),
                 'images': image_paths,
                 'prompts': video_prompts,
-                'completed_videos': [],
-                'video_paths': [],
                 'start_time': total_start_time,
                 'phase': 'video_generation',
                 'session_image_dir': os.path.join(self.image_dir, session_id),
@@ -805,109 +1122,117 @@ class MinimaxService:
             checkpoint['images'] = image_paths
             checkpoint['prompts'] = video_prompts
             checkpoint['video_start_time'] = total_start_time
-            
+        # 진행 중 저장(저널 정리 포함)에도 완료 목록이 반영되도록 같은 리스트를 연결
+        checkpoint['completed_videos'] = completed_videos
+        checkpoint['video_paths'] = video_paths
+        
         self._save_checkpoint(session_id, checkpoint)
         
         # 남은 이미지들만 처리
-        remaining_images = image_paths[start_index:]
-        if not remaining_images:
-            print(f"✅ All videos already completed!")
-            return video_paths
+        if not pending_indices:
+            logger.info(f"✅ All videos already completed!")
+            return self._order_by_index(completed_videos, video_paths)
         
-        # 2개씩 배치 처리 (더 효율적)
-        batch_size = 2
-        for batch_start in range(0, len(remaining_images), batch_size):
-            batch_end = min(batch_start + batch_size, len(remaining_images))
-            batch_images = remaining_images[batch_start:batch_end]
-            
-            actual_start = start_index + batch_start
-            actual_end = start_index + batch_end
-            
-            print(f"\n🔄 Processing batch {batch_start//batch_size + 1}/{(len(remaining_images) + batch_size - 1)//batch_size}")
-            print(f"   Videos {actual_start + 1}-{actual_end}")
-            
-            # 배치 실행
-            batch_results = []  # 초기화 추가
-            
-            async def create_single_video(index: int, image_path: str):
-                real_index = actual_start + index
+        # 세마포어는 작업 제출(인코딩 + POST)에만 적용 - 제출된 작업의 대기/다운로드는 슬롯을 잡지 않으므로
+        # 앞선 비디오가 렌더링되는 동안에도 다음 비디오 제출이 계속 진행됨 (폴링 빈도는 조회 속도 제한기로 제어)
+        sem = asyncio.Semaphore(max_concurrent)
+        failures = []  # (인덱스, 오류) - 실패한 비디오
+        # 각 비디오를 제출할 때 다음 차례 이미지를 미리 인코딩
+        next_image = {i: image_paths[j] for i, j in zip(pending_indices, pending_indices[1:])}
+        
+        async def create_single_video(real_index: int):
+            async with sem:
+                if failures:
+                    return None  # 앞서 실패했으면 아직 제출하지 않은 비디오는 건너뜀
                 
+                image_path = image_paths[real_index]
                 if not image_path or not os.path.exists(image_path):
                     error_msg = f"No image available for video {real_index+1}"
-                    print(f"[Video {real_index+1}/{len(image_paths)}] ❌ {error_msg}")
+                    logger.warning(f"[Video {real_index+1}/{len(image_paths)}] ❌ {error_msg}")
+                    failures.append((real_index, error_msg))
                     raise RuntimeError(error_msg)
                 
                 # 해당 장면의 프롬프트 가져오기
                 scene_prompt = video_prompts[real_index] if video_prompts and real_index < len(video_prompts) else None
                 
-                print(f"[Video {real_index+1}/{len(image_paths)}] 🚀 Starting batch generation...")
-                print(f"  📁 Image: {os.path.basename(image_path)}")
+                logger.info(f"[Video {real_index+1}/{len(image_paths)}] 🚀 Starting generation...")
+                logger.info(f"  📁 Image: {os.path.basename(image_path)}")
                 if scene_prompt:
-                    print(f"  📝 Prompt: {scene_prompt[:50]}...")
+                    logger.info(f"  📝 Prompt: {scene_prompt[:50]}...")
                 
-                async with aiohttp.ClientSession() as session:
-                    try:
-                        video_start_time = time.time()
-                        video_path = await self._create_single_video(session, image_path, real_index, scene_prompt, session_id)
-                        video_time = int(time.time() - video_start_time)
-                        
-                        if video_path:
-                            print(f"[Video {real_index+1}/{len(image_paths)}] ✅ Completed in {video_time}s")
-                            return real_index, video_path
-                        else:
-                            error_msg = f"Failed to create video {real_index+1} after {video_time}s"
-                            print(f"[Video {real_index+1}/{len(image_paths)}] ❌ {error_msg}")
-                            raise RuntimeError(error_msg)
-                            
-                    except Exception as e:
-                        error_msg = f"Error creating video {real_index+1}: {e}"
-                        print(f"[Video {real_index+1}/{len(image_paths)}] ❌ {error_msg}")
-                        raise RuntimeError(error_msg)
+                video_start_time = time.time()
+                if real_index in next_image:
+                    self._prefetch_image(next_image[real_index])
+                task_id = await self._submit_video_task(session, image_path, scene_prompt)
             
-            tasks = [create_single_video(i, image_path) for i, image_path in enumerate(batch_images)]
-            batch_results = await asyncio.gather(*tasks)  # return_exceptions=True 제거
+            # 슬롯을 반납한 뒤 완료 대기 및 다운로드
+            video_path = await self._finish_video_task(session, task_id, real_index, session_id) if task_id else ""
+            video_time = int(time.time() - video_start_time)
             
-            try:
-                # 성공한 결과들 추가 및 체크포인트 업데이트
-                for real_index, video_path in batch_results:
-                    video_paths.append(video_path)
-                    completed_videos.append(real_index)
-                    
-                    # 각 비디오 완료 후 체크포인트 저장
-                    checkpoint['completed_videos'] = completed_videos
-                    checkpoint['video_paths'] = video_paths
-                    checkpoint['last_completed_index'] = real_index
+            if video_path:
+                logger.info(f"[Video {real_index+1}/{len(image_paths)}] ✅ Completed in {video_time}s")
+                return real_index, video_path
+            
+            error_msg = f"Failed to create video {real_index+1} after {video_time}s"
+            logger.warning(f"[Video {real_index+1}/{len(image_paths)}] ❌ {error_msg}")
+            failures.append((real_index, error_msg))
+            raise RuntimeError(error_msg)
+        
+        # 모든 비디오 작업이 끝날 때까지 공유 세션을 사용 중으로 표시
+        session = http_session or await self._acquire_session()
+        tasks = [asyncio.create_task(create_single_video(i)) for i in pending_indices]
+        
+        # 끝나는 순서대로 저널에 기록
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    result = await next_done
+                except Exception:
+                    continue  # 실패는 failures에 기록됨 - 이미 진행 중인 비디오는 끝까지 받아 저장
+                if result is None:
+                    continue
+                real_index, video_path = result
+                video_paths.append(video_path)
+                completed_videos.append(real_index)
+                # 완료 항목은 저널에만 추가하고 전체 체크포인트는 저널이 충분히 쌓였을 때만 다시 저장
+                if self._journal_completed(session_id, 'video', real_index, video_path):
+                    checkpoint['last_completed_index'] = max(completed_videos)
                     checkpoint['last_update'] = time.time()
                     self._save_checkpoint(session_id, checkpoint)
-                    
-            except Exception as e:
-                # 실패 시 체크포인트 저장 후 중단
-                failed_index = actual_start + len(batch_results)  # 이제 batch_results가 항상 정의됨
-                checkpoint['failed_at'] = {
-                    'index': failed_index,
-                    'error': str(e),
-                    'timestamp': time.time()
-                }
-                self._save_checkpoint(session_id, checkpoint)
-                
-                print(f"\n{'='*60}")
-                print(f"❌ VIDEO GENERATION FAILED - STOPPING PROCESS")
-                print(f"Error: {e}")
-                print(f"Completed videos: {len(completed_videos)}/{len(image_paths)}")
-                print(f"💾 Progress saved to checkpoint: {session_id}")
-                print(f"🔄 To resume, use the same session_id: {session_id}")
-                print(f"{'='*60}")
-                raise RuntimeError(f"Video generation failed: {e}")
-            
-            # 배치 간 대기 (API 제한 방지)
-            if actual_end < len(image_paths):
-                print(f"⏳ Waiting 5 seconds before next batch...")
-                await asyncio.sleep(5)
+        finally:
+            # 호출 측이 취소된 경우 남은 작업이 백그라운드에서 계속 API를 호출하지 않도록 정리
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            await self._discard_prefetched(image_paths)
+            if http_session is None:
+                await self._release_session()
+        
+        if completed_videos:
+            checkpoint['last_completed_index'] = max(completed_videos)
+        checkpoint['last_update'] = time.time()
         
-            # 배치 간 대기 (API 제한 방지)
-            if actual_end < len(image_paths):
-                print(f"⏳ Waiting 10 seconds before next batch...")
-                await asyncio.sleep(10)
+        if failures:
+            # 실패 시 체크포인트 저장 후 중단
+            failed_index, e = min(failures, key=lambda f: f[0])
+            checkpoint['failed_at'] = {
+                'index': failed_index,
+                'error': str(e),
+                'timestamp': time.time()
+            }
+            self._save_checkpoint(session_id, checkpoint)
+            await asyncio.to_thread(self._checkpoint_writer.flush)
+            
+            logger.warning(f"\n{'='*60}")
+            logger.warning(f"❌ VIDEO GENERATION FAILED - STOPPING PROCESS")
+            logger.warning(f"Error: {e}")
+            logger.warning(f"Completed videos: {len(completed_videos)}/{len(image_paths)}")
+            logger.warning(f"💾 Progress saved to checkpoint: {session_id}")
+            logger.warning(f"🔄 To resume, use the same session_id: {session_id}")
+            logger.warning(f"{'='*60}")
+            raise RuntimeError(f"Video generation failed: {e}")
         
         total_time = int(time.time() - total_start_time)
         success_count = len(video_paths)
@@ -917,26 +1242,30 @@ class MinimaxService:
         checkpoint['completion_time'] = time.time()
         checkpoint['video_total_time'] = total_time
         self._save_checkpoint(session_id, checkpoint)
+        await asyncio.to_thread(self._checkpoint_writer.flush)
         
-        print(f"\n{'='*60}")
-        print(f"🎉 ALL VIDEOS GENERATED SUCCESSFULLY!")
-        print(f"  Session ID: {session_id}")
-        print(f"  Total time: {total_time // 60}m {total_time % 60}s")
-        print(f"  Success rate: {success_count}/{len(image_paths)}")
-        print(f"  Average time per video: {total_time // len(image_paths) if image_paths else 0}s")
-        print(f"{'='*60}\n")
+        logger.info(f"\n{'='*60}")
+        logger.info(f"🎉 ALL VIDEOS GENERATED SUCCESSFULLY!")
+        logger.info(f"  Session ID: {session_id}")
+        logger.info(f"  Total time: {total_time // 60}m {total_time % 60}s")
+        logger.info(f"  Success rate: {success_count}/{len(image_paths)}")
+        logger.info(f"  Average time per video: {total_time // len(image_paths) if image_paths else 0}s")
+        logger.info(f"{'='*60}\n")
         
-        return video_paths
+        # 완료 순서로 쌓인 결과를 이미지 순서로 정렬해 반환
+        return self._order_by_index(completed_videos, video_paths)
 
-    async def _create_single_video(self, session: aiohttp.ClientSession, image_path: str, index: int, scene_prompt: str = None, session_id: str = None) -> str:
-        """단일 이미지로 비디오 생성"""
+    async def _submit_video_task(self, session: aiohttp.ClientSession, image_path: str, scene_prompt: str = None) -> str:
+        """비디오 생성 작업 제출 - task_id 반환 (실패 시 빈 문자열)"""
         try:
-            # 이미지를 base64로 인코딩
-            with open(image_path, "rb") as img_file:
-                image_base64 = base64.b64encode(img_file.read()).decode()
-            
-            # Minimax Video Generation API 호출
-            url = f"{self.base_url}/video_generation"
+            # 이미지를 base64 Data URL로 인코딩 (CPU 작업이라 스레드에서 처리해 폴링/다운로드가 멈추지 않도록)
+            # 앞선 비디오 제출 중에 미리 시작한 인코딩이 있으면 그 결과를 사용
+            prefetched = self._prefetch_tasks.pop(image_path, None)
+            if prefetched is not None:
+                first_frame_image = await prefetched
+            else:
+                mime_type = _MIME.get(os.path.splitext(image_path)[1].lower(), "image/jpeg")
+                first_frame_image = await asyncio.to_thread(self._build_image_data_url, image_path, mime_type)
             
             # 동적 프롬프트 생성
             if scene_prompt:
@@ -946,233 +1275,204 @@ class MinimaxService:
                 # 기본 프롬프트
                 video_prompt = "Create smooth, natural camera movement and bring the scene to life with subtle animations"
             
-            # I2V 모델 선택 - 더 빠른 모델 사용
-            # I2V-01: 표준 모델, 균형잡힌 품질과 속도
-            # I2V-01-live: 더 빠른 처리, 라이브 스트리밍에 최적화
-            model_choice = "I2V-01-live"  # 더 빠른 처리를 위해 live 버전 사용
-            
+            # 파라미터 dict는 바로 직렬화되고 수정되지 않으므로 인스턴스 기본값을 그대로 공유
             payload = {
-                "model": model_choice,
+                "model": self._video_model,
                 "prompt": video_prompt[:200],  # 프롬프트 길이 더욱 단축 (500 -> 200)
-                "first_frame_image": f"data:image/jpeg;base64,{image_base64}",
-                "parameters": {
-                    "prompt_optimizer": False,  # 빠른 처리를 위해 비활성화
-                    "motion_strength": 0.3,  # 움직임 강도 증가 (0.1 -> 0.3) - 6초 동안 더 많은 동작
-                    "video_length": 6  # 비디오 길이 6초로 변경
-                }
+                "first_frame_image": first_frame_image,
+                "parameters": self._default_params
             }
             
-            print(f"  🎬 Creating {payload['parameters']['video_length']}s video...")
-            print(f"  📝 Prompt: {video_prompt[:60]}...")
-            print(f"  🖼️  Image: {os.path.basename(image_path)}")
-            print(f"  Starting video generation...")
+            logger.info(f"  🎬 Creating {self._default_params['video_length']}s video...")
+            logger.info(f"  📝 Prompt: {video_prompt[:60]}...")
+            logger.info(f"  🖼️  Image: {os.path.basename(image_path)}")
+            logger.info(f"  Starting video generation...")
             
+            # 분당 요청 수 제한 (배치 간 고정 대기 대신)
+            await self._video_limiter.acquire()
+            
+            # 엔드포인트가 JSON만 받으므로 multipart 대신 수 MB짜리 본문을 orjson으로 한 번에 bytes로 직렬화
             async with session.post(
-                url,
-                json=payload,
-                headers=self.headers,
-                timeout=aiohttp.ClientTimeout(total=600)  # 5분 타임아웃
+                self._gen_url,
+                data=_json_dumps(payload),
+                headers=self._req_headers,
+                timeout=_VIDEO_POST_TIMEOUT
             ) as response:
-                response_text = await response.text()
-                print(f"  API Response status: {response.status}")
+                body = await response.read()
+                logger.info(f"  API Response status: {response.status}")
                 
                 if response.status != 200:
-                    print(f"  API Error: {response.status}")
-                    print(f"  Error details: {response_text[:500]}")
+                    logger.warning(f"  API Error: {response.status}")
+                    logger.warning(f"  Error details: {body[:500].decode('utf-8', errors='replace')}")
                     return ""
                     
-                result = json.loads(response_text)
-                
-                # base_resp 체크
-                if "base_resp" in result:
-                    base_resp = result["base_resp"]
-                    if base_resp.get("status_code") != 0:
-                        print(f"  API error: {base_resp.get('status_code')} - {base_resp.get('status_msg')}")
-                        return ""
+            result = _json_loads(body)
+            
+            # base_resp 체크
+            if "base_resp" in result:
+                base_resp = result["base_resp"]
+                if base_resp.get("status_code") != 0:
+                    logger.warning(f"  API error: {base_resp.get('status_code')} - {base_resp.get('status_msg')}")
+                    return ""
+            
+            # 성공적인 응답 처리 - task_id 반환
+            task_id = _dig(result, *_TASK_ID_PATHS)
+            
+            if not task_id:
+                logger.warning(f"  No task_id in response")
+                logger.warning(f"  Response structure: {json.dumps(result, indent=2)[:500]}")
+                return ""
+            
+            logger.info(f"  Task created successfully: {task_id}")
+            return task_id
                 
-                # 성공적인 응답 처리 - task_id 반환
-                task_id = None
-                if "task_id" in result:
-                    task_id = result["task_id"]
-                elif "data" in result and "task_id" in result["data"]:
-                    task_id = result["data"]["task_id"]
-                    
-                if task_id:
-                    print(f"  Task created successfully: {task_id}")
-                    print(f"  Waiting for video generation to complete...")
-                    
-                    file_id = await self._wait_for_video_task(session, task_id)
-                    if file_id:
-                        # file_id가 URL인 경우
-                        if file_id.startswith("http"):
-                            print(f"  Direct video URL received")
-                            return await self._download_video(session, file_id, index, session_id)
-                        else:
-                            # file_id인 경우 retrieve API 호출
-                            video_url = await self._get_file_url(session, file_id)
-                            if video_url:
-                                return await self._download_video(session, video_url, index, session_id)
-                            else:
-                                print(f"  Failed to retrieve download URL")
-                                return ""
-                    else:
-                        print(f"  Video generation failed or timed out")
-                        return ""
-                else:
-                    print(f"  No task_id in response")
-                    print(f"  Response structure: {json.dumps(result, indent=2)[:500]}")
+        except asyncio.TimeoutError:
+            logger.warning(f"  Timeout creating video after 5 minutes")
+            return ""
+        except Exception as e:
+            logger.exception("  Error in video creation: %s", e)
+            return ""
+
+    async def _finish_video_task(self, session: aiohttp.ClientSession, task_id: str, index: int, session_id: str = None) -> str:
+        """제출된 비디오 작업 완료 대기 후 다운로드 - 저장 경로 반환 (실패 시 빈 문자열)"""
+        try:
+            logger.info(f"  Waiting for video generation to complete...")
+            file_id = await self._wait_for_video_task(session, task_id)
+            if not file_id:
+                logger.warning(f"  Video generation failed or timed out")
+                return ""
+            
+            # file_id가 URL인 경우
+            if file_id.startswith("http"):
+                logger.info(f"  Direct video URL received")
+                return await self._download_video(session, file_id, index, session_id)
+            
+            # file_id인 경우 retrieve API 호출
+            video_url = await self._get_file_url(session, file_id)
+            if not video_url:
+                logger.warning(f"  Failed to retrieve download URL")
                 return ""
+            return await self._download_video(session, video_url, index, session_id)
                 
         except asyncio.TimeoutError:
-            print(f"  Timeout creating video after 5 minutes")
+            logger.warning(f"  Timeout waiting for video task {task_id}")
             return ""
         except Exception as e:
-            print(f"  Error in video creation: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("  Error in video creation: %s", e)
             return ""
 
     async def _wait_for_video_task(self, session: aiohttp.ClientSession, task_id: str) -> str:
-        """비디오 생성 작업 완료 대기 - file_id 반환"""
-        max_attempts = 1200  # 최대 10분 대기 (2초 간격, 테스트용 더 단축)
+        """비디오 생성 작업 완료 대기 - file_id 반환 (폴링 간격은 2초부터 최대 15초까지 점차 증가)"""
+        max_wait_seconds = 2400  # 최대 40분 대기 (기존 2초 x 1200회와 동일)
         attempt = 0
         last_status = None
+        delay = 2.0
         start_time = time.time()
         
         # 비디오 작업 상태 확인 URL
-        check_url = f"{self.base_url}/query/video_generation"
+        check_url = self._query_url
         
-        print(f"  ⏱️  Monitoring task: {task_id}")
-        print(f"  Expected: 1-5 minutes (I2V-01-live model, 2s videos, 5min timeout)")
+        logger.info(f"  ⏱️  Monitoring task: {task_id}")
+        logger.info(f"  Expected: 1-5 minutes (I2V-01-live model, 2s videos, 5min timeout)")
         
-        while attempt < max_attempts:
+        while time.time() - start_time < max_wait_seconds:
             try:
                 params = {"task_id": task_id}
                 
+                await self._video_query_limiter.acquire()
                 async with session.get(
                     check_url,
                     params=params,
-                    headers=self.headers
+                    headers=self._req_headers
                 ) as response:
                     if response.status == 200:
-                        result = await response.json()
+                        # 문자열로 디코딩하지 않고 bytes에서 바로 파싱
+                        result = _json_loads(await response.read())
                         
-                        # 상세 로그는 처음 몇 번과 상태 변경 시에만 출력
-                        if attempt < 3 or (attempt % 15 == 0):  # 30초마다
-                            print(f"  📊 Check #{attempt+1}: {json.dumps(result, indent=2)[:200]}...")
+                        # 상세 로그는 DEBUG 레벨에서 처음 몇 번과 약 1분마다만 출력 (응답 직렬화 비용도 생략)
+                        if logger.isEnabledFor(logging.DEBUG) and (attempt < 3 or attempt % 4 == 0):
+                            logger.debug(f"  📊 Check #{attempt+1}: {_json_dumps(result).decode('utf-8')[:200]}...")
                         
                         # base_resp 체크
                         if "base_resp" in result:
                             base_resp = result["base_resp"]
                             if base_resp.get("status_code") != 0:
                                 error_msg = f"Query error: {base_resp.get('status_code')} - {base_resp.get('status_msg')}"
-                                print(f"  ❌ {error_msg}")
+                                logger.warning(f"  ❌ {error_msg}")
                                 raise RuntimeError(error_msg)
                         
-                        # 다양한 상태 필드 확인
-                        status = None
-                        
                         # status 확인 (여러 위치에서)
-                        if "status" in result:
-                            status = result["status"]
-                        elif "data" in result and "status" in result["data"]:
-                            status = result["data"]["status"]
-                        elif "task_status" in result:
-                            status = result["task_status"]
-                            
-                        # 상태가 변경되었거나 30초마다 업데이트
-                        if status != last_status or (attempt % 15 == 0):
+                        status = _dig(result, *_STATUS_PATHS)
+                        
+                        # 상태가 변경되었거나 약 1분마다 업데이트
+                        if status != last_status or (attempt % 4 == 0):
                             elapsed_time = int(time.time() - start_time)
                             elapsed_min = elapsed_time // 60
                             elapsed_sec = elapsed_time % 60
-                            print(f"  🔄 [{elapsed_min}:{elapsed_sec:02d}] Status: {status}")
+                            logger.info(f"  🔄 [{elapsed_min}:{elapsed_sec:02d}] Status: {status}")
+                            if status != last_status:
+                                delay = 2.0  # 상태가 바뀌면 다시 짧은 간격부터 확인
                             last_status = status
                         
-                        # 완료 상태 확인
-                        if status in ["finished", "success", "completed", "done", "FINISHED", "SUCCESS", "COMPLETED", "Success"]:
+                        # 완료 상태 확인 (대소문자 표기가 제각각이라 한 번 소문자로 맞춘 뒤 비교)
+                        status_key = status.lower() if isinstance(status, str) else status
+                        if status_key in _VIDEO_DONE_STATUSES:
                             elapsed_time = int(time.time() - start_time)
-                            print(f"  ✅ Completed in {elapsed_time}s!")
+                            logger.info(f"  ✅ Completed in {elapsed_time}s!")
+                            
+                            # file_id 찾기 (직접 URL이 반환되는 경우 포함)
+                            file_id = _dig(result, *_FILE_ID_PATHS)
+                            if file_id:
+                                return file_id
                             
-                            # file_id 찾기
-                            if "file_id" in result:
-                                return result["file_id"]
-                            elif "data" in result:
-                                data = result["data"]
-                                if "file_id" in data:
-                                    return data["file_id"]
-                                elif "video" in data and isinstance(data["video"], dict):
-                                    if "file_id" in data["video"]:
-                                        return data["video"]["file_id"]
-                                    elif "url" in data["video"]:
-                                        # 직접 URL이 반환되는 경우
-                                        return data["video"]["url"]
-                                elif "url" in data:
-                                    # 직접 URL이 반환되는 경우
-                                    return data["url"]
-                        
                             # file_id나 URL을 찾을 수 없는 경우
                             error_msg = "Video generated but no file_id or URL found in response"
-                            print(f"  ❌ {error_msg}")
+                            logger.warning(f"  ❌ {error_msg}")
                             raise RuntimeError(error_msg)
                         
-                        elif status in ["failed", "error", "FAILED", "ERROR", "Fail"]:
+                        elif status_key in _VIDEO_FAILED_STATUSES:
                             elapsed_time = int(time.time() - start_time)
                             error_msg = result.get("message") or result.get("error_msg") or "Unknown error"
                             full_error = f"Video generation failed after {elapsed_time}s: {error_msg}"
-                            print(f"  ❌ {full_error}")
+                            logger.warning(f"  ❌ {full_error}")
                             raise RuntimeError(full_error)
                         
                         # 진행 중인 경우 계속 대기
-                        elif status in ["processing", "pending", "queued", "running", "PROCESSING", "PENDING", "QUEUED", "RUNNING"]:
-                            # 진행률이 있으면 표시
-                            progress = None
-                            if "progress" in result:
-                                progress = result["progress"]
-                            elif "data" in result and "progress" in result["data"]:
-                                progress = result["data"]["progress"]
-                                
-                            if progress is not None and progress > 0:
-                                print(f"  📈 Progress: {progress}%")
-                        
-                        # 진행 중인 경우 계속 대기
-                        elif status in ["processing", "pending", "queued", "running", "PROCESSING", "PENDING", "QUEUED", "RUNNING", "Processing", "Preparing", "Queueing"]:
+                        elif status_key in _VIDEO_PROGRESS_STATUSES:
                             # 진행률이 있으면 표시
-                            progress = None
-                            if "progress" in result:
-                                progress = result["progress"]
-                            elif "data" in result and "progress" in result["data"]:
-                                progress = result["data"]["progress"]
-                                
+                            progress = _dig(result, *_PROGRESS_PATHS)
+                            
                             if progress is not None and progress > 0:
-                                print(f"  📈 Progress: {progress}%")
+                                logger.debug(f"  📈 Progress: {progress}%")
                     else:
-                        print(f"  ⚠️  Status check failed: HTTP {response.status}")
+                        logger.warning(f"  ⚠️  Status check failed: HTTP {response.status}")
                         
             except RuntimeError:
                 # 이미 처리된 에러는 다시 발생
                 raise
             except Exception as e:
-                if attempt % 30 == 0:  # 1분마다만 에러 로그 출력
-                    print(f"  ⚠️  Network error (attempt {attempt}): {e}")
+                if attempt % 4 == 0:  # 약 1분마다만 에러 로그 출력
+                    logger.warning(f"  ⚠️  Network error (attempt {attempt}): {e}")
                 
-            # 2초마다 확인 (기존 3초에서 단축)
-            await asyncio.sleep(2)
+            # 지수 백오프 (2 → 3 → 4.5 ... 최대 15초) + 지터로 동시 작업의 폴링 시점 분산
+            await asyncio.sleep(delay + random.uniform(0, 0.5))
+            delay = min(delay * 1.5, 15)
             attempt += 1
             
         # 타임아웃 발생
         total_time = int(time.time() - start_time)
         timeout_msg = f"Video generation timeout after {total_time // 60}m {total_time % 60}s"
-        print(f"  ⏰ {timeout_msg}")
+        logger.warning(f"  ⏰ {timeout_msg}")
         raise RuntimeError(timeout_msg)
         
     async def _get_file_url(self, session: aiohttp.ClientSession, file_id: str) -> str:
         """file_id로 다운로드 URL 획득"""
         try:
             # Files Retrieve API 사용
-            url = f"{self.base_url}/files/retrieve"
+            url = self._retrieve_url
             
-            print(f"🔍 Retrieving download URL for file_id: {file_id}")
-            print(f"📡 API endpoint: {url}")
+            logger.info(f"🔍 Retrieving download URL for file_id: {file_id}")
+            logger.debug(f"📡 API endpoint: {url}")
             
             # Group ID 포함 파라미터
             params = {
@@ -1182,257 +1482,411 @@ class MinimaxService:
             # Group ID가 설정되어 있으면 추가
             if self.group_id:
                 params["GroupId"] = self.group_id
-                print(f"🏢 Using Group ID: {self.group_id}")
+                logger.debug(f"🏢 Using Group ID: {self.group_id}")
             
-            async with session.get(
+            # 429/5xx 같은 일시적 오류는 백오프 후 재시도
+            status, body = await self._request_with_retry(
+                session, "GET",
                 url,
                 params=params,
-                headers=self.headers,
-                timeout=aiohttp.ClientTimeout(total=30)
-            ) as response:
-                response_text = await response.text()
-                print(f"📄 File retrieve response status: {response.status}")
-                print(f"📄 Response content: {response_text[:500]}...")
+                headers=self._req_headers,
+                timeout=_FILE_URL_TIMEOUT
+            )
+            response_text = body.decode("utf-8", errors="replace")
+            logger.info(f"📄 File retrieve response status: {status}")
+            logger.debug(f"📄 Response content: {response_text[:500]}...")
+            
+            if status == 200:
+                try:
+                    result = _json_loads(body)
+                except json.JSONDecodeError as e:
+                    logger.warning(f"❌ Failed to parse JSON response: {e}")
+                    return ""
                 
-                if response.status == 200:
-                    try:
-                        result = json.loads(response_text)
-                    except json.JSONDecodeError as e:
-                        print(f"❌ Failed to parse JSON response: {e}")
-                        return ""
-                    
-                    # base_resp 체크
-                    if "base_resp" in result:
-                        base_resp = result["base_resp"]
-                        if base_resp.get("status_code") != 0:
-                            error_msg = f"File retrieve error: {base_resp.get('status_code')} - {base_resp.get('status_msg')}"
-                            print(f"❌ {error_msg}")
-                            return ""
-                    
-                    # 다양한 위치에서 다운로드 URL 찾기
-                    download_url = None
-                    
-                    # 우선순위별로 URL 검색
-                    search_paths = [
-                        # 가장 일반적인 경로들
-                        ["file", "download_url"],
-                        ["download_url"],
-                        ["url"],
-                        ["data", "download_url"],
-                        ["data", "url"],
-                        ["data", "file", "download_url"],
-                        ["data", "file", "url"],
-                        ["file", "url"],
-                        # 비디오 관련 경로들
-                        ["video", "download_url"],
-                        ["video", "url"],
-                        ["data", "video", "download_url"],
-                        ["data", "video", "url"],
-                        # 파일 관련 경로들
-                        ["file_url"],
-                        ["data", "file_url"],
-                        # 추가 가능한 경로들
-                        ["files", "download_url"],
-                        ["files", "url"]
-                    ]
-                    
-                    for path in search_paths:
-                        current = result
-                        try:
-                            for key in path:
-                                current = current[key]
-                            if isinstance(current, str) and current.startswith("http"):
-                                download_url = current
-                                print(f"✅ Found download URL at path: {' -> '.join(path)}")
-                                break
-                        except (KeyError, TypeError):
-                            continue
-                    
-                    if download_url:
-                        print(f"✅ Download URL: {download_url[:100]}...")
-                        return download_url
-                    else:
-                        print(f"❌ Could not find download URL in response")
-                        print(f"📄 Full response structure:")
-                        print(json.dumps(result, indent=2, ensure_ascii=False)[:1000])
+                # base_resp 체크
+                if "base_resp" in result:
+                    base_resp = result["base_resp"]
+                    if base_resp.get("status_code") != 0:
+                        error_msg = f"File retrieve error: {base_resp.get('status_code')} - {base_resp.get('status_msg')}"
+                        logger.warning(f"❌ {error_msg}")
                         return ""
-                        
-                elif response.status == 404:
-                    print(f"❌ File not found: {file_id}")
-                    return ""
+                
+                # 다양한 위치에서 다운로드 URL 찾기 (우선순위 순)
+                download_url = None
+                for path in _DOWNLOAD_URL_PATHS:
+                    current = _dig(result, path)
+                    if isinstance(current, str) and current.startswith("http"):
+                        download_url = current
+                        logger.info(f"✅ Found download URL at path: {' -> '.join(path)}")
+                        break
+                
+                if download_url:
+                    logger.info(f"✅ Download URL: {download_url[:100]}...")
+                    return download_url
                 else:
-                    print(f"❌ Failed to get file URL: HTTP {response.status}")
-                    print(f"📄 Error response: {response_text[:500]}")
+                    logger.warning(f"❌ Could not find download URL in response")
+                    logger.warning(f"📄 Full response structure:\n{json.dumps(result, indent=2, ensure_ascii=False)[:1000]}")
                     return ""
                     
+            elif status == 404:
+                logger.warning(f"❌ File not found: {file_id}")
+                return ""
+            else:
+                logger.warning(f"❌ Failed to get file URL: HTTP {status}")
+                logger.warning(f"📄 Error response: {response_text[:500]}")
+                return ""
+                
         except asyncio.TimeoutError:
-            print(f"❌ Timeout getting file URL after 30 seconds")
+            logger.warning(f"❌ Timeout getting file URL after 30 seconds")
             return ""
         except Exception as e:
-            print(f"❌ Error getting file URL: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ Error getting file URL: %s", e)
             
         return ""
         
     async def _download_video(self, session: aiohttp.ClientSession, url: str, index: int, session_id: str = None) -> str:
         """URL에서 비디오 다운로드"""
         try:
-            print(f"  Downloading video file...")
+            logger.info(f"  Downloading video file...")
             
             # 비디오 파일은 크기가 클 수 있으므로 충분한 타임아웃 설정
             async with session.get(
                 url, 
-                timeout=aiohttp.ClientTimeout(total=1200)  # 5분 타임아웃
+                timeout=_VIDEO_DOWNLOAD_TIMEOUT
             ) as response:
                 if response.status == 200:
                     # 파일 크기 확인
                     content_length = response.headers.get('Content-Length')
                     if content_length:
-                        print(f"  Video file size: {int(content_length) / (1024*1024):.2f} MB")
-                    
-                    content = await response.read()
+                        logger.info(f"  Video file size: {int(content_length) / (1024*1024):.2f} MB")
                     
                     # 세션 ID별 폴더 생성
+                    target_dir = self.video_dir
                     if session_id:
-                        session_video_dir = os.path.join(self.video_dir, session_id)
-                        os.makedirs(session_video_dir, exist_ok=True)
-                        video_filename = f"video_{index}.mp4"
-                        video_path = os.path.join(session_video_dir, video_filename)
-                        print(f"  📁 Saving to session folder: {session_id}/")
-                    else:
-                        video_filename = f"video_{index}.mp4"
-                        video_path = os.path.join(self.video_dir, video_filename)
-                    
-                    with open(video_path, 'wb') as f:
-                        f.write(content)
+                        target_dir = os.path.join(self.video_dir, session_id)
+                        await asyncio.to_thread(os.makedirs, target_dir, exist_ok=True)
+                        logger.info(f"  📁 Saving to session folder: {session_id}/")
+                    video_path = os.path.join(target_dir, f"video_{index}.mp4")
                     
-                    # 파일이 제대로 저장되었는지 확인
-                    if os.path.exists(video_path):
-                        file_size = os.path.getsize(video_path)
-                        print(f"  ✓ Video saved: {os.path.relpath(video_path, self.video_dir)} ({file_size / (1024*1024):.2f} MB)")
-                        return video_path
-                    else:
-                        print(f"  ✗ Failed to save video file")
+                    file_size = await self._stream_to_file(response, video_path)
+                    if not file_size:
                         return ""
+                    
+                    logger.info(f"  ✓ Video saved: {os.path.relpath(video_path, self.video_dir)} ({file_size / (1024*1024):.2f} MB)")
+                    return video_path
                 else:
-                    print(f"  ✗ Failed to download video: HTTP {response.status}")
+                    logger.warning(f"  ✗ Failed to download video: HTTP {response.status}")
                     error_text = await response.text()
-                    print(f"  Error response: {error_text[:300]}")
+                    logger.warning(f"  Error response: {error_text[:300]}")
                     return ""
                     
         except asyncio.TimeoutError:
-            print(f"  ✗ Timeout downloading video after 5 minutes")
+            logger.warning(f"  ✗ Timeout downloading video after 5 minutes")
         except Exception as e:
-            print(f"  ✗ Error downloading video: {e}")
+            logger.warning(f"  ✗ Error downloading video: {e}")
             
         return ""
 
-    async def create_videos_with_optimized_prompts(self, image_paths: List[str], optimized_prompts: List[str]) -> List[str]:
-        """클래식 워크플로우용: 선택된 이미지들과 최적화된 프롬프트들로 비디오 생성"""
+    def _create_http_session(self) -> aiohttp.ClientSession:
+        """연결 풀 설정을 튜닝한 aiohttp 세션 생성"""
+        connector = aiohttp.TCPConnector(
+            limit=64,
+            limit_per_host=16,
+            ttl_dns_cache=300,
+            # 폴링 간격(최대 수십 초) 동안 유휴 연결이 닫혀 TLS 핸드셰이크를 반복하지 않도록 유지
+            keepalive_timeout=75,
+            enable_cleanup_closed=True
+        )
+        # 전체 타임아웃 없이 소켓 읽기만 제한 (긴 폴링/다운로드가 세션 타임아웃으로 끊기지 않도록)
+        timeout = aiohttp.ClientTimeout(total=None, sock_read=60)
+        # Bearer 토큰 인증만 사용하므로 쿠키 저장/매칭 생략
+        return aiohttp.ClientSession(connector=connector, timeout=timeout, cookie_jar=aiohttp.DummyCookieJar())
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """공유 aiohttp 세션 반환 (없거나 닫혔거나 다른 이벤트 루프면 새로 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            if self._session is not None and not self._session.closed:
+                # 이전 루프(asyncio.run 호출이 끝난 경우 등)의 세션은 연결을 정리한 뒤 교체
+                try:
+                    await self._session.close()
+                except Exception:
+                    # 원래 루프가 이미 닫혀 소켓 정리가 실패해도 세션은 닫힌 것으로 처리
+                    pass
+            self._session = self._create_http_session()
+            self._session_loop = loop
+        return self._session
+
+    async def _acquire_session(self) -> aiohttp.ClientSession:
+        """공유 세션 사용 시작 (사용 중인 동안에는 async with 종료로 세션이 닫히지 않음)"""
+        self._session_users += 1
+        return await self._get_session()
+
+    async def _release_session(self):
+        """공유 세션 사용 종료 - async with가 만든 세션이면 마지막 사용자가 끝날 때 닫음"""
+        self._session_users -= 1
+        if self._session_users == 0 and self._close_when_idle:
+            await self.aclose()
+
+    async def __aenter__(self):
+        """async with 블록 동안 공유 세션 유지 (중첩/동시 사용은 참조 수로 관리)"""
+        session = self._session
+        if session is None or session.closed or self._session_loop is not asyncio.get_running_loop():
+            # 이 블록이 새로 만든 세션만 닫음 - 이미 쓰던 공유 세션은 연결 재사용을 위해 유지
+            self._close_when_idle = True
+        await self._acquire_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self._release_session()
+        return False
+
+    async def aclose(self):
+        """공유 세션 종료"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+        self._close_when_idle = False
+
+    async def _stream_to_file(self, response: aiohttp.ClientResponse, out_path: str) -> int:
+        """응답 본문을 1MB씩 바로 파일에 기록 - 저장한 바이트 수 반환 (빈 파일/재생 불가 파일은 삭제 후 0)"""
+        # 전체 영상을 메모리에 모으지 않으므로 동시 다운로드 수만큼 메모리가 늘지 않음
+        file_size = 0
+        async with aiofiles.open(out_path, 'wb') as f:
+            async for chunk in response.content.iter_chunked(1 << 20):
+                await f.write(chunk)
+                file_size += len(chunk)
+        
+        # 빈 파일은 성공으로 기록하지 않음
+        if file_size == 0:
+            logger.warning(f"  ✗ Downloaded video is empty: {os.path.basename(out_path)}")
+            await asyncio.to_thread(os.remove, out_path)
+            return 0
+        
+        # 체크포인트에 기록하기 전에 재생 가능한 파일인지 확인 (스레드에서 실행)
+        if _FFPROBE and not await asyncio.to_thread(_probe_video, out_path):
+            logger.warning(f"  ✗ Downloaded video is not playable (ffprobe failed): {os.path.basename(out_path)}")
+            await asyncio.to_thread(os.remove, out_path)
+            return 0
+        
+        # 저장 후 바로 다시 읽지 않으므로 page cache에서 제거
+        await asyncio.to_thread(self._drop_page_cache, out_path)
+        return file_size
+
+    async def _poll_and_download(self, session: aiohttp.ClientSession, task_id: str, out_path: str) -> str:
+        """비디오 작업 완료 대기 → 다운로드 URL 확인 → 파일 저장을 한 번에 처리"""
+        video_result = await self._wait_for_video_task(session, task_id)
+        if not video_result:
+            logger.warning(f"❌ Video generation failed (task_id: {task_id})")
+            return ""
+        
+        # URL이 바로 오면 그대로, file_id면 다운로드 URL로 변환
+        if video_result.startswith("http"):
+            video_url = video_result
+        else:
+            video_url = await self._get_file_url(session, video_result)
+            if not video_url:
+                logger.warning(f"❌ Failed to get download URL (task_id: {task_id})")
+                return ""
+        
+        logger.info(f"📥 Downloading video: {os.path.basename(out_path)}")
+        async with session.get(video_url, timeout=_VIDEO_DOWNLOAD_TIMEOUT) as response:
+            if response.status != 200:
+                logger.warning(f"❌ Failed to download video: HTTP {response.status}")
+                return ""
+            file_size = await self._stream_to_file(response, out_path)
+            if not file_size:
+                return ""
+        
+        logger.info(f"✅ Video downloaded: {out_path} ({file_size / (1024*1024):.2f} MB)")
+        return out_path
+
+    def _drop_page_cache(self, file_path: str):
+        """저장이 끝난 파일의 page cache 해제 요청 (posix_fadvise 미지원 플랫폼에서는 무시)"""
+        if not hasattr(os, 'posix_fadvise'):
+            return
+        try:
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                # DONTNEED는 아직 디스크에 기록되지 않은(dirty) 페이지는 버리지 않으므로 먼저 기록
+                os.fdatasync(fd)
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
+
+    def _retry_delay(self, attempt: int, retry_after: str = None) -> float:
+        """재시도 대기 시간 계산 - Retry-After 헤더 우선, 없으면 지수 백오프 + 지터"""
+        if retry_after:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass  # HTTP-date 형식은 무시하고 백오프 사용
+        return min(2 ** attempt, 30) + random.random()
+
+    async def _request_with_retry(self, session: aiohttp.ClientSession, method: str, url: str, max_attempts: int = 5, **kwargs) -> tuple:
+        """429/5xx 응답 시 백오프 후 재시도 - (status, body bytes) 반환"""
+        for attempt in range(max_attempts):
+            async with session.request(method, url, **kwargs) as response:
+                status = response.status
+                body = await response.read()
+                if status not in _RETRY_STATUSES or attempt == max_attempts - 1:
+                    return status, body
+                retry_after = response.headers.get("Retry-After")
+            
+            delay = self._retry_delay(attempt, retry_after)
+            logger.warning(f"⚠️ HTTP {status} from {url} - retrying in {delay:.1f}s ({attempt + 1}/{max_attempts})")
+            await asyncio.sleep(delay)
+
+    def _prefetch_image(self, image_path: str):
+        """다음 이미지의 읽기/인코딩을 미리 시작 (현재 업로드의 네트워크 대기와 겹치도록)"""
+        if not image_path or image_path in self._prefetch_tasks or not os.path.exists(image_path):
+            return
+        mime_type = _MIME.get(os.path.splitext(image_path)[1].lower(), "image/jpeg")
+        self._prefetch_tasks[image_path] = asyncio.create_task(
+            asyncio.to_thread(self._build_image_data_url, image_path, mime_type)
+        )
+
+    async def _discard_prefetched(self, image_paths: List[str]):
+        """사용되지 않은 미리 읽기 작업 정리"""
+        leftover = [task for task in (self._prefetch_tasks.pop(path, None) for path in image_paths) if task is not None]
+        for task in leftover:
+            task.cancel()
+        if leftover:
+            await asyncio.gather(*leftover, return_exceptions=True)
+
+    def _build_image_data_url(self, image_path: str, mime_type: str) -> str:
+        """이미지 파일을 base64 Data URL 문자열로 변환 (파일 경로/수정 시각/크기 기준으로 캐시)"""
+        st = os.stat(image_path)
+        return _encode_image_data_url(image_path, mime_type, st.st_mtime_ns, st.st_size)
+
+    async def create_videos_with_optimized_prompts(self, image_paths: List[str], optimized_prompts: List[str], max_concurrent: int = 8, encode_workers: int = 2) -> List[str]:
+        """클래식 워크플로우용: 선택된 이미지들과 최적화된 프롬프트들로 비디오 생성 (인코딩 → 요청 → 폴링/다운로드 파이프라인)"""
         
         if len(image_paths) != len(optimized_prompts):
-            print(f"Error: Mismatch between images ({len(image_paths)}) and prompts ({len(optimized_prompts)})")
+            logger.warning(f"Error: Mismatch between images ({len(image_paths)}) and prompts ({len(optimized_prompts)})")
             return []
         
-        print(f"🎬 Creating {len(image_paths)} videos with optimized prompts...")
+        total = len(image_paths)
+        logger.info(f"🎬 Creating {total} videos with optimized prompts (max {max_concurrent} concurrent)...")
+        
+        # 단계별 큐: 인코딩 대기 → 요청 대기(인코딩된 본문) → 폴링/다운로드 대기(task_id)
+        # 요청 큐는 크기를 제한해 인코딩된 base64 본문이 메모리에 쌓이지 않도록 함
+        encode_q: asyncio.Queue = asyncio.Queue()
+        post_q: asyncio.Queue = asyncio.Queue(maxsize=max_concurrent)
+        poll_q: asyncio.Queue = asyncio.Queue()
+        for item in enumerate(zip(image_paths, optimized_prompts)):
+            encode_q.put_nowait(item)
         
-        async with aiohttp.ClientSession() as session:
-            video_paths = []
+        # 입력 순서대로 결과 저장 (실패한 항목은 빈 문자열)
+        video_paths = [""] * total
+        ok = 0
+        
+        # 하나의 세션을 모든 헬퍼(폴링, file URL 조회, 다운로드)에 전달해 연결 재사용
+        async with self._create_http_session() as session:
             
-            for i, (image_path, prompt) in enumerate(zip(image_paths, optimized_prompts)):
-                try:
-                    print(f"\n📹 Generating video {i+1}/{len(image_paths)}")
-                    print(f"🖼️ Image: {os.path.basename(image_path)}")
-                    print(f"📝 Prompt: {prompt[:100]}...")
-                    
-                    # 이미지를 base64로 인코딩
-                    with open(image_path, "rb") as image_file:
-                        base64_data = base64.b64encode(image_file.read()).decode('utf-8')
-                    
-                    # 파일 확장자에 따른 MIME 타입 결정
-                    file_ext = os.path.splitext(image_path)[1].lower()
-                    if file_ext in ['.png']:
-                        mime_type = 'image/png'
-                    else:
-                        mime_type = 'image/jpeg'
-                    
-                    # Data URL 형식으로 변환
-                    data_url = f"data:{mime_type};base64,{base64_data}"
-                    
-                    print(f"📊 Image format: {mime_type}, Base64 length: {len(base64_data)}")
-                    
-                    # Minimax 비디오 생성 API 호출
-                    payload = {
-                        "model": "video-01",
-                        "prompt": prompt,
-                        "first_frame_image": data_url,  # Data URL 형식 사용
-                    }
-                    
-                    async with session.post(
-                        f"{self.base_url}/video_generation",
-                        headers=self.headers,
-                        json=payload
-                    ) as response:
+            async def encode_worker():
+                while not encode_q.empty():
+                    i, (image_path, prompt) = encode_q.get_nowait()
+                    try:
+                        # 파일 확장자에 따른 MIME 타입 결정
+                        mime_type = _MIME.get(os.path.splitext(image_path)[1].lower(), 'image/jpeg')
+
+                        # 로컬 파일을 base64 Data URL로 변환
+                        # (인코딩은 CPU 작업이므로 스레드에서 실행해 다른 영상의 폴링/다운로드를 막지 않음)
+                        first_frame_image = await asyncio.to_thread(self._build_image_data_url, image_path, mime_type)
+
+                        # 비디오별 시작 로그는 한 번의 로그 호출로 출력
+                        logger.info(
+                            f"\n📹 Generating video {i+1}/{total}\n"
+                            f"🖼️ Image: {os.path.basename(image_path)}\n"
+                            f"📝 Prompt: {prompt[:100]}...\n"
+                            f"📊 Image format: {mime_type}, first_frame_image length: {len(first_frame_image)}"
+                        )
+                        
+                        # Minimax 비디오 생성 API 요청 본문
+                        # 수 MB짜리 base64 문자열이 포함되므로 직렬화는 orjson으로 한 번에 처리
+                        payload = {
+                            "model": "video-01",
+                            "prompt": prompt,
+                            "first_frame_image": first_frame_image,  # 로컬 이미지를 인코딩한 base64 Data URL
+                        }
+                        await post_q.put((i, _json_dumps(payload)))
+                    except Exception as e:
+                        logger.exception("❌ Error encoding image for video %d: %s", i + 1, e)
+            
+            async def post_worker():
+                while (item := await post_q.get()) is not None:
+                    i, request_body = item
+                    try:
+                        # 429/5xx 같은 일시적 오류는 백오프 후 재시도
+                        status, body = await self._request_with_retry(
+                            session, "POST",
+                            self._gen_url,
+                            headers=self._req_headers,
+                            data=request_body,
+                            timeout=_VIDEO_POST_TIMEOUT
+                        )
                         
-                        print(f"📡 API Response Status: {response.status}")
+                        if status != 200:
+                            logger.warning(
+                                f"❌ API error for video {i+1}: {status}\n"
+                                f"📄 Error response: {body.decode('utf-8', errors='replace')}"
+                            )
+                            continue
                         
-                        if response.status == 200:
-                            response_data = await response.json()
-                            print(f"✅ Video generation request successful")
-                            print(f"📄 Response: {response_data}")
-                            
-                            task_id = response_data.get("task_id")
-                            if task_id:
-                                print(f"⏳ Waiting for video generation (task_id: {task_id})...")
-                                
-                                # 작업 완료 대기
-                                video_result = await self._wait_for_video_task(session, task_id)
-                                
-                                if video_result:
-                                    if video_result.startswith("http"):
-                                        # URL인 경우 바로 다운로드
-                                        video_url = video_result
-                                    else:
-                                        # file_id인 경우 URL로 변환
-                                        print(f"🔗 Converting file_id to download URL...")
-                                        video_url = await self._get_file_url(session, video_result)
-                                    
-                                    if video_url:
-                                        # 비디오 다운로드
-                                        video_filename = f"classic_video_{i+1}_{task_id}.mp4"
-                                        video_path = await self._download_single_video(session, video_url, video_filename)
-                                        
-                                        if video_path:
-                                            print(f"🎉 Video {i+1} generated successfully: {os.path.basename(video_path)}")
-                                            video_paths.append(video_path)
-                                        else:
-                                            print(f"❌ Failed to download video {i+1}")
-                                            video_paths.append("")
-                                    else:
-                                        print(f"❌ Failed to get download URL for video {i+1}")
-                                        video_paths.append("")
-                                else:
-                                    print(f"❌ Video generation failed for video {i+1}")
-                                    video_paths.append("")
-                            else:
-                                print(f"❌ No task_id received for video {i+1}")
-                                video_paths.append("")
+                        response_data = _json_loads(body)
+                        logger.info(f"✅ Video {i+1} generation request successful (status {status})")
+                        
+                        task_id = response_data.get("task_id")
+                        if not task_id:
+                            logger.warning(f"❌ No task_id received for video {i+1}")
+                            continue
+                        
+                        logger.info(f"⏳ Waiting for video generation (task_id: {task_id})...")
+                        await poll_q.put((i, task_id))
+                    except Exception as e:
+                        logger.exception("❌ Error requesting video %d: %s", i + 1, e)
+            
+            async def poll_worker():
+                nonlocal ok
+                while (item := await poll_q.get()) is not None:
+                    i, task_id = item
+                    try:
+                        # 작업 완료 대기 + 다운로드
+                        video_path = os.path.join(self.video_dir, f"classic_video_{i+1}_{task_id}.mp4")
+                        if await self._poll_and_download(session, task_id, video_path):
+                            logger.info(f"🎉 Video {i+1} generated successfully: {os.path.basename(video_path)}")
+                            video_paths[i] = video_path
+                            ok += 1
                         else:
-                            error_text = await response.text()
-                            print(f"❌ API error for video {i+1}: {response.status}")
-                            print(f"📄 Error response: {error_text}")
-                            video_paths.append("")
-                            
-                except Exception as e:
-                    print(f"❌ Error generating video {i+1}: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    video_paths.append("")
-            
-            print(f"\n📊 Video generation summary:")
-            print(f"   Requested: {len(image_paths)}")
-            print(f"   Successful: {len([p for p in video_paths if p])}")
-            print(f"   Failed: {len([p for p in video_paths if not p])}")
+                            logger.warning(f"❌ Failed to generate video {i+1}")
+                    except Exception as e:
+                        logger.exception("❌ Error generating video %d: %s", i + 1, e)
+            
+            encoders = [asyncio.create_task(encode_worker()) for _ in range(encode_workers)]
+            posters = [asyncio.create_task(post_worker()) for _ in range(max_concurrent)]
+            pollers = [asyncio.create_task(poll_worker()) for _ in range(max_concurrent)]
+            
+            try:
+                # 앞 단계가 끝나면 다음 단계 워커 수만큼 종료 신호(None) 전달
+                await asyncio.gather(*encoders)
+                for _ in posters:
+                    await post_q.put(None)
+                await asyncio.gather(*posters)
+                for _ in pollers:
+                    await poll_q.put(None)
+                await asyncio.gather(*pollers)
+            finally:
+                # 호출 측이 취소된 경우 남은 워커 정리
+                for task in (*encoders, *posters, *pollers):
+                    task.cancel()
+            
+            logger.info(f"\n📊 Video generation summary:")
+            logger.info(f"   Requested: {total}")
+            logger.info(f"   Successful: {ok}")
+            logger.info(f"   Failed: {total - ok}")
             
             return video_paths
\ No newline at end of file
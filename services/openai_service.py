@@ -1,19 +1,329 @@
 # app/services/openai_service.py
-from openai import AsyncOpenAI
-from typing import List, Dict, Tuple
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+import httpx
+from typing import List, Dict, Optional, Tuple
 import asyncio
 import os
-import base64
-import json
+import binascii
+import io
+import mmap
+import multiprocessing
+import re
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pydantic import BaseModel, ValidationError
+
+try:
+    import pybase64  # SIMD(AVX2/NEON) base64 구현
+    _b64encode = pybase64.b64encode
+except ImportError:
+    # pybase64 미설치 시 base64 모듈 래퍼를 거치지 않고 binascii C 인코더 직접 사용
+    def _b64encode(data) -> bytes:
+        return binascii.b2a_base64(data, newline=False)
+
+try:
+    import h2  # noqa: F401 - 설치되어 있으면 httpx가 HTTP/2로 연결 (httpx[http2])
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+try:
+    from PIL import Image, ImageOps  # 큰 이미지 축소용
+except ImportError:
+    Image = None
+
+# Vision 모델이 내부적으로 약 1024px 기준으로 처리하므로 그보다 큰 이미지는 줄여서 전송
+_MAX_IMAGE_SIDE = 1024
+
+def _downscale_jpeg(path: str):
+    """긴 변이 _MAX_IMAGE_SIDE보다 크면 축소 후 JPEG로 다시 인코딩 (축소가 필요 없으면 None)"""
+    # Image.open은 헤더만 먼저 읽으므로 작은 이미지는 픽셀을 디코딩하지 않고 바로 반환
+    with Image.open(path) as img:
+        if max(img.size) <= _MAX_IMAGE_SIDE:
+            return None
+        # 다시 인코딩하면 EXIF가 빠지므로 회전 정보를 먼저 픽셀에 반영
+        img = ImageOps.exif_transpose(img)
+        img.thumbnail((_MAX_IMAGE_SIDE, _MAX_IMAGE_SIDE), Image.LANCZOS)
+        if img.mode not in ("RGB", "L"):
+            img = img.convert("RGB")
+        buf = io.BytesIO()
+        img.save(buf, "JPEG", quality=85, optimize=True)
+        return buf.getvalue()
+
+def _sniff_mime(head: bytes) -> str:
+    """파일 앞부분 시그니처로 이미지 MIME 타입 판별 (알 수 없으면 image/jpeg)"""
+    if head.startswith(b"\x89PNG"):
+        return "image/png"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    if head.startswith(b"GIF8"):
+        return "image/gif"
+    return "image/jpeg"
+
+# 청크 단위 인코딩 크기 (3바이트 배수여야 이어 붙인 결과가 전체 인코딩과 같음)
+_ENCODE_CHUNK = 3 * 65536
+
+def _encode_data_url(mime_type: str, data) -> str:
+    """Data URL 접두어와 base64 결과를 미리 크기를 잡은 버퍼 하나에 청크 단위로 기록"""
+    prefix = f"data:{mime_type};base64,".encode('ascii')
+    size = len(data)
+    out = bytearray(len(prefix) + (size + 2) // 3 * 4)
+    out[:len(prefix)] = prefix
+    pos = len(prefix)
+    with memoryview(data) as view:
+        for start in range(0, size, _ENCODE_CHUNK):
+            encoded = _b64encode(view[start:start + _ENCODE_CHUNK])
+            out[pos:pos + len(encoded)] = encoded
+            pos += len(encoded)
+    return out.decode('ascii')
+
+def _load_data_url(path: str) -> str:
+    """이미지 파일을 읽어 base64 Data URL 문자열로 변환 (스레드에서 실행)"""
+    # 큰 사진은 축소해서 전송량과 인코딩 비용 절감 (Pillow가 없거나 읽을 수 없는 형식이면 원본 그대로)
+    if Image is not None:
+        try:
+            resized = _downscale_jpeg(path)
+        except Exception as e:
+            print(f"⚠️ 이미지 축소 실패, 원본 사용: {e}")
+            resized = None
+        if resized is not None:
+            return _encode_data_url("image/jpeg", resized)
+    
+    with open(path, "rb") as image_file:
+        # 빈 파일은 mmap 불가
+        if os.fstat(image_file.fileno()).st_size == 0:
+            return _encode_data_url("image/jpeg", b"")
+        # 파일 전체를 bytes로 복사하지 않고 매핑된 페이지에서 바로 인코딩
+        with mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # 확장자와 관계없이 실제 형식으로 MIME 지정 (PNG/WebP 업로드를 JPEG로 표시하지 않도록)
+            return _encode_data_url(_sniff_mime(mm[:12]), mm)
+
+# 응답 형태 모델 - model_validate_json이 파싱과 타입 검사를 한 번에 처리 (pydantic-core)
+class _SelectionResult(BaseModel):
+    selected_index: int = 0
+    reason: str = "AI selected this image as most suitable"
+    video_prompt: str = "Smooth cinematic movement bringing the scene to life"
+
+class _PromptList(BaseModel):
+    prompts: List[str]
+
+class _SceneList(BaseModel):
+    scenes: List[str]
+
+# 응답을 JSON 객체로 강제 (JSON 모드는 배열을 직접 반환하지 않으므로 목록은 객체 안의 키로 요청)
+_JSON_OBJECT = {"type": "json_object"}
+
+# 고정 시스템 프롬프트 (호출마다 다시 만들지 않도록 모듈 상수로 정의)
+_SELECT_SYSTEM_PROMPT = """You are an expert at selecting the best image for video generation and creating optimized video prompts.
+
+Analyze the provided images and:
+1. Select the image that best matches the user's description and original pet photo
+2. Create an optimized video prompt for the selected image
+
+Consider these criteria for image selection:
+- Visual quality and clarity
+- Similarity to the original pet photo (breed, color, characteristics)
+- Relevance to user's description
+- Suitability for video animation
+- Composition and lighting
+
+For video prompt creation:
+- 15-25 words describing natural movements
+- Natural, realistic motion
+- Cinematic quality
+- Works well with the selected image as starting frame
+
+Return ONLY a JSON object in this format:
+{
+    "selected_index": 0,
+    "reason": "Brief explanation of why this image is best",
+    "video_prompt": "Optimized video prompt for smooth natural animation"
+}"""
+
+_TEN_STEP_SYSTEM_PROMPT = """You are a creative writing assistant that creates scene descriptions for image generation.
+
+Create 10 scene descriptions in English based on the user's story and uploaded image.
+
+Requirements:
+1. Analyze the uploaded image to understand the subject's characteristics
+2. Create 10 sequential scenes that tell a natural story
+3. Each scene should be 20-30 words in English
+4. Focus on actions, emotions, and environments
+5. Make scenes suitable for image generation
+6. Include these style parameters at the end of each prompt: --style raw --style photographic --v 6 --ar 9:16 consistent lighting
+
+Return as JSON object:
+{"scenes": ["scene 1 description", "scene 2 description", ..., "scene 10 description"]}"""
+
+# 이보다 큰 파일은 별도 프로세스에서 축소/인코딩 (GIL을 잡는 작업이 이벤트 루프 스레드와 경쟁하지 않도록)
+_PROCESS_POOL_MIN_BYTES = 4 * 1024 * 1024
+
+# 인코딩 결과 캐시 최대 항목 수 (축소된 이미지 기준 수십 MB 이내)
+_DATA_URL_CACHE_SIZE = 32
+
+# 폴백 프롬프트 (호출마다 리스트를 새로 만들지 않도록 모듈 수준 튜플로 한 번만 생성)
+# 겨울 박스 구조 스토리
+_WINTER_BOX_STEPS = (
+    "pet in box on snowy street",
+    "pet being discovered in box",
+    "pet being gently held",
+    "pet at warm home",
+    "pet playing happily indoors"
+)
+# 뛰어오는 스토리
+_RUNNING_STEPS = (
+    "pet sitting calmly",
+    "pet noticing something",
+    "pet starting to run",
+    "pet running joyfully",
+    "pet reaching destination"
+)
+# 기본 일상 스토리
+_DAILY_STEPS = (
+    "pet resting peacefully",
+    "pet looking around curiously",
+    "pet standing up",
+    "pet moving around",
+    "pet playing happily"
+)
+
+# 구조 스토리
+_RESCUE_STORY = (
+    "A lonely cardboard box sits on a snowy street under a lamppost on a freezing winter night. --ar 3:2 --style cinematic --v 6",
+    "A person in warm winter clothes notices the box and approaches it slowly in the snow. --ar 3:2 --style cinematic --v 6",
+    "The person carefully opens the box, revealing a frightened, shivering puppy inside. --ar 3:2 --style photorealistic --v 6",
+    "The person gently holds the cold puppy close, wrapping it warmly and walking away from the snow. --ar 3:2 --style cinematic --v 6",
+    "At home, the person hugs the puppy warmly under soft indoor lighting. --ar 3:2 --style cozy lighting --v 6",
+    "The puppy sits curled up in a corner of the room, looking nervous and unsure in the new place. --ar 3:2 --style warm tone --v 6",
+    "The puppy slowly begins to eat from a bowl, its body relaxed and more comfortable. --ar 3:2 --style domestic --v 6",
+    "The puppy happily plays with several toys scattered across a cozy living room carpet. --ar 3:2 --style playful --v 6",
+    "The puppy looks up at the person with a big smile, eyes full of trust and happiness. --ar 3:2 --style joyful --v 6",
+    "The puppy runs toward the camera, full of energy and joy, as if greeting its best friend. --ar 3:2 --style energetic --v 6"
+)
+# 일반적인 강아지 일상 스토리
+_DAILY_STORY = (
+    "A cute dog sits peacefully in a beautiful outdoor setting with natural lighting. --ar 3:2 --style cinematic --v 6",
+    "The same dog begins to move around, exploring its surroundings with curiosity. --ar 3:2 --style photorealistic --v 6",
+    "The dog discovers something interesting and approaches it with excitement. --ar 3:2 --style cinematic --v 6",
+    "The dog plays happily, showing joy and energy in a warm, inviting environment. --ar 3:2 --style playful --v 6",
+    "The dog interacts with its environment, displaying natural and endearing behavior. --ar 3:2 --style cozy lighting --v 6",
+    "The dog enjoys a peaceful moment, resting in a comfortable and safe place. --ar 3:2 --style warm tone --v 6",
+    "The dog shows affection and trust, creating a heartwarming scene. --ar 3:2 --style joyful --v 6",
+    "The dog engages in playful activity, demonstrating its personality and charm. --ar 3:2 --style domestic --v 6",
+    "The dog looks directly at the camera with a friendly and welcoming expression. --ar 3:2 --style energetic --v 6",
+    "The dog runs with pure joy and freedom, embodying happiness and vitality. --ar 3:2 --style cinematic --v 6"
+)
+
+_SCENE_STYLE = "--style raw --style photographic --v 6 --ar 9:16 consistent lighting"
+_KINDERGARTEN_SCENES = (
+    f"A photorealistic cute puppy getting ready at home, looking excited with bright eyes and wagging tail, natural lighting, professional photography. {_SCENE_STYLE}",
+    f"The same photorealistic puppy walking towards a colorful kindergarten building with other puppies visible in the background, lifelike detail. {_SCENE_STYLE}",
+    f"The realistic puppy arriving at the kindergarten entrance, meeting friendly staff and other puppies for the first time, natural scene. {_SCENE_STYLE}",
+    f"The photorealistic puppy cautiously exploring the kindergarten playground, sniffing around with curiosity and wonder, real dog behavior. {_SCENE_STYLE}",
+    f"The realistic puppy starting to play with colorful toys scattered around the kindergarten play area, natural lighting. {_SCENE_STYLE}",
+    f"The photorealistic puppy meeting and greeting other puppies, beginning to form new friendships through gentle interactions, lifelike. {_SCENE_STYLE}",
+    f"The realistic puppy actively playing with other puppies, running around together in the safe kindergarten environment, natural motion. {_SCENE_STYLE}",
+    f"The photorealistic puppy engaged in group play activities, showing joy and excitement while interacting with multiple puppies, real photo. {_SCENE_STYLE}",
+    f"The realistic puppy and friends playing their favorite games together, showing pure happiness and playful energy, professional photography. {_SCENE_STYLE}",
+    f"The tired but happy photorealistic puppy resting after playtime, surrounded by new friends in a peaceful moment, natural lighting. {_SCENE_STYLE}"
+)
+_GENERIC_SCENES = (
+    f"A photorealistic character preparing for an important journey or activity, showing determination and readiness, natural lighting. {_SCENE_STYLE}",
+    f"The same realistic character taking the first steps toward their goal, moving with purpose and confidence, lifelike detail. {_SCENE_STYLE}",
+    f"The photorealistic character arriving at their destination, taking in the new environment with curiosity, real photo style. {_SCENE_STYLE}",
+    f"The realistic character beginning their main activity, showing focus and initial engagement, professional photography. {_SCENE_STYLE}",
+    f"The photorealistic character becoming more involved in the activity, showing growing enthusiasm and skill, natural scene. {_SCENE_STYLE}",
+    f"The realistic character interacting with others or elements in the environment, building connections, lifelike interaction. {_SCENE_STYLE}",
+    f"The photorealistic character reaching a peak moment of activity, showing intense focus and energy, natural lighting. {_SCENE_STYLE}",
+    f"The realistic character experiencing a breakthrough or special moment, radiating joy and accomplishment, real photo. {_SCENE_STYLE}",
+    f"The photorealistic character completing their main activity with satisfaction and sense of achievement, professional photography. {_SCENE_STYLE}",
+    f"The realistic character reflecting on the experience, showing contentment and peaceful completion, natural lighting. {_SCENE_STYLE}"
+)
+
+# 설명 키워드 → 폴백 프롬프트 (패턴이 모두 일치하는 첫 규칙 사용)
+_STEP_FALLBACK_RULES = (
+    ((re.compile("박스"), re.compile("강아지")), _WINTER_BOX_STEPS),
+    ((re.compile("뛰어|달려"),), _RUNNING_STEPS),
+)
+_STORY_FALLBACK_RULES = (
+    ((re.compile("구조|rescue", re.IGNORECASE),), _RESCUE_STORY),
+)
+_SCENE_FALLBACK_RULES = (
+    ((re.compile("강아지"), re.compile("유치원|놀이")), _KINDERGARTEN_SCENES),
+)
+
+def _match_fallback(rules, text: str, default):
+    """(패턴들, 프롬프트) 규칙 중 패턴이 모두 일치하는 첫 프롬프트 반환 (없으면 default)"""
+    for patterns, prompts in rules:
+        if all(pattern.search(text) for pattern in patterns):
+            return prompts
+    return default
 
 class OpenAIService:
     def __init__(self):
         api_key = os.getenv("OPENAI_API_KEY")
         if api_key:
-            self.client = AsyncOpenAI(api_key=api_key)
+            # 모든 호출이 하나의 연결 풀을 공유 (가능하면 HTTP/2로 한 TLS 연결에서 요청을 다중화)
+            http_client = DefaultAsyncHttpxClient(
+                http2=_HTTP2,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+            )
+            self.client = AsyncOpenAI(api_key=api_key, http_client=http_client)
         else:
             self.client = None
-            
+        
+        # (경로, 수정 시각, 크기) -> Data URL LRU 캐시 (선택 → 비디오 프롬프트 → 스토리에서 같은 업로드 이미지 재사용)
+        self._data_url_cache: "OrderedDict[tuple, str]" = OrderedDict()
+        # 동시에 읽고 인코딩하는 이미지 수 제한 (요청이 몰려도 스레드 풀과 메모리를 다 쓰지 않도록)
+        self._io_sem = asyncio.Semaphore(8)
+        # 큰 파일용 프로세스 풀 (처음 필요할 때 생성)
+        self._cpu_pool: Optional[ProcessPoolExecutor] = None
+    
+    async def _read_data_url(self, path: str) -> str:
+        """이미지를 Data URL로 변환 - 파일 읽기와 base64 인코딩은 스레드에서 처리 (이벤트 루프가 다른 요청을 계속 처리하도록)"""
+        st = os.stat(path)
+        key = (path, st.st_mtime_ns, st.st_size)
+        cached = self._data_url_cache.get(key)
+        if cached is not None:
+            self._data_url_cache.move_to_end(key)
+            return cached
+        
+        async with self._io_sem:
+            if st.st_size > _PROCESS_POOL_MIN_BYTES:
+                encoded = await self._load_in_process_pool(path)
+            else:
+                encoded = await asyncio.to_thread(_load_data_url, path)
+        self._data_url_cache[key] = encoded
+        if len(self._data_url_cache) > _DATA_URL_CACHE_SIZE:
+            self._data_url_cache.popitem(last=False)
+        return encoded
+    
+    async def _load_in_process_pool(self, path: str) -> str:
+        """큰 이미지를 프로세스 풀에서 디코딩/인코딩 (풀이 깨졌으면 다음 요청 때 새로 생성)"""
+        pool = self._cpu_pool
+        if pool is None:
+            # 실행 중인 멀티스레드 서버 프로세스를 fork하지 않도록 spawn으로 작업자 시작
+            pool = self._cpu_pool = ProcessPoolExecutor(
+                max_workers=min(4, os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        try:
+            return await asyncio.get_running_loop().run_in_executor(pool, _load_data_url, path)
+        except BrokenProcessPool:
+            # 작업자 프로세스가 죽으면 풀 전체를 쓸 수 없으므로 버리고, 이번 요청은 스레드에서 처리
+            print("⚠️ Image process pool broke, recreating it on next use")
+            if self._cpu_pool is pool:
+                self._cpu_pool = None
+            pool.shutdown(wait=False)
+            return await asyncio.to_thread(_load_data_url, path)
+    
+    def close(self):
+        """프로세스 풀 종료 (앱 종료 시 호출)"""
+        if self._cpu_pool is not None:
+            self._cpu_pool.shutdown(wait=False, cancel_futures=True)
+            self._cpu_pool = None
+    
     async def select_best_image_and_create_video_prompt(self, image_paths: List[str], original_prompts: List[str], user_description: str, uploaded_image_path: str) -> Tuple[int, str, str]:
         """
         생성된 이미지들 중 가장 적합한 이미지를 선택하고, 해당 이미지에 최적화된 비디오 프롬프트를 생성
@@ -32,24 +342,25 @@ class OpenAIService:
             return 0, "Only one image available", "Smooth cinematic movement bringing the scene to life"
         
         try:
-            # 업로드된 원본 이미지 인코딩
-            with open(uploaded_image_path, "rb") as image_file:
-                original_base64 = base64.b64encode(image_file.read()).decode('utf-8')
+            # 업로드된 원본 이미지와 생성된 이미지들을 병렬로 인코딩
+            original_url, *encoded_images = await asyncio.gather(
+                self._read_data_url(uploaded_image_path),
+                *[self._read_data_url(image_path) for image_path in image_paths],
+                return_exceptions=True
+            )
+            if isinstance(original_url, BaseException):
+                raise original_url
             
-            # 생성된 이미지들 인코딩
             image_data_list = []
-            for i, image_path in enumerate(image_paths):
-                try:
-                    with open(image_path, "rb") as image_file:
-                        base64_image = base64.b64encode(image_file.read()).decode('utf-8')
-                        image_data_list.append({
-                            "index": i,
-                            "data": base64_image,
-                            "prompt": original_prompts[i] if i < len(original_prompts) else "No prompt available"
-                        })
-                except Exception as e:
-                    print(f"Error loading image {i}: {e}")
+            for i, data_url in enumerate(encoded_images):
+                if isinstance(data_url, BaseException):
+                    print(f"Error loading image {i}: {data_url}")
                     continue
+                image_data_list.append({
+                    "index": i,
+                    "data": data_url,
+                    "prompt": original_prompts[i] if i < len(original_prompts) else "No prompt available"
+                })
             
             if not image_data_list:
                 return 0, "No valid images found", "Smooth cinematic movement bringing the scene to life"
@@ -58,31 +369,7 @@ class OpenAIService:
             messages = [
                 {
                     "role": "system",
-                    "content": """You are an expert at selecting the best image for video generation and creating optimized video prompts.
-
-Analyze the provided images and:
-1. Select the image that best matches the user's description and original pet photo
-2. Create an optimized video prompt for the selected image
-
-Consider these criteria for image selection:
-- Visual quality and clarity
-- Similarity to the original pet photo (breed, color, characteristics)
-- Relevance to user's description
-- Suitability for video animation
-- Composition and lighting
-
-For video prompt creation:
-- 15-25 words describing natural movements
-- Natural, realistic motion
-- Cinematic quality
-- Works well with the selected image as starting frame
-
-Return ONLY a JSON object in this format:
-{
-    "selected_index": 0,
-    "reason": "Brief explanation of why this image is best",
-    "video_prompt": "Optimized video prompt for smooth natural animation"
-}"""
+                    "content": _SELECT_SYSTEM_PROMPT
                 },
                 {
                     "role": "user",
@@ -94,7 +381,7 @@ Return ONLY a JSON object in this format:
                         {
                             "type": "image_url",
                             "image_url": {
-                                "url": f"data:image/jpeg;base64,{original_base64}"
+                                "url": original_url
                             }
                         },
                         {
@@ -105,7 +392,7 @@ Return ONLY a JSON object in this format:
                         {
                             "type": "image_url",
                             "image_url": {
-                                "url": f"data:image/jpeg;base64,{img_data['data']}"
+                                "url": img_data['data']
                             }
                         } for img_data in image_data_list
                     ]
@@ -116,28 +403,19 @@ Return ONLY a JSON object in this format:
                 model="gpt-4o",
                 messages=messages,
                 temperature=0.3,
-                max_tokens=300
+                max_tokens=300,
+                response_format=_JSON_OBJECT
             )
             
             response_text = response.choices[0].message.content.strip()
             print(f"OpenAI selection response: {response_text}")
             
-            # JSON 마크다운 제거 및 파싱
+            # JSON 파싱 (JSON 모드라 코드 블록 없이 객체로 응답)
             try:
-                # ```json 및 ``` 제거
-                clean_text = response_text
-                if clean_text.startswith("```json"):
-                    clean_text = clean_text[7:]
-                if clean_text.startswith("```"):
-                    clean_text = clean_text[3:]
-                if clean_text.endswith("```"):
-                    clean_text = clean_text[:-3]
-                clean_text = clean_text.strip()
-                
-                result = json.loads(clean_text)
-                selected_index = result.get("selected_index", 0)
-                reason = result.get("reason", "AI selected this image as most suitable")
-                video_prompt = result.get("video_prompt", "Smooth cinematic movement bringing the scene to life")
+                result = _SelectionResult.model_validate_json(response_text)
+                selected_index = result.selected_index
+                reason = result.reason
+                video_prompt = result.video_prompt
                 
                 # 인덱스 유효성 검사
                 if 0 <= selected_index < len(image_paths):
@@ -145,7 +423,7 @@ Return ONLY a JSON object in this format:
                 else:
                     return 0, f"Invalid index {selected_index}, using first image", video_prompt
                     
-            except json.JSONDecodeError as e:
+            except ValidationError as e:
                 print(f"JSON decode error: {e}")
                 return 0, "Failed to parse selection response, using first image", "Smooth cinematic movement bringing the scene to life"
                 
@@ -167,9 +445,8 @@ Return ONLY a JSON object in this format:
         """
         
         try:
-            # 이미지를 base64로 인코딩
-            with open(image_path, "rb") as image_file:
-                base64_image = base64.b64encode(image_file.read()).decode('utf-8')
+            # 이미지를 base64 Data URL로 인코딩
+            data_url = await self._read_data_url(image_path)
             
             # OpenAI Vision API로 단계별 프롬프트 생성 요청
             messages = [
@@ -188,13 +465,13 @@ Return ONLY a JSON object in this format:
 - 오직 장면과 동작만 설명하세요
 - 자연스럽고 안전한 일상 장면으로 만들어주세요
 
-JSON 배열 형태로 답변해주세요:
-["step1 action", "step2 action", "step3 action", "step4 action", "step5 action"]"""
+JSON 객체 형태로 답변해주세요:
+{{"prompts": ["step1 action", "step2 action", "step3 action", "step4 action", "step5 action"]}}"""
                         },
                         {
                             "type": "image_url",
                             "image_url": {
-                                "url": f"data:image/jpeg;base64,{base64_image}"
+                                "url": data_url
                             }
                         }
                     ]
@@ -205,34 +482,25 @@ JSON 배열 형태로 답변해주세요:
                 model="gpt-4o",
                 messages=messages,
                 temperature=0.7,
-                max_tokens=1000
+                max_tokens=40 * num_steps + 60,  # 단계당 3-6단어 + JSON 구조
+                response_format=_JSON_OBJECT
             )
             
             response_text = response.choices[0].message.content.strip()
             print(f"OpenAI step prompts response: {response_text[:200]}...")
             
-            # JSON 마크다운 제거 및 파싱
+            # JSON 파싱 (JSON 모드라 코드 블록 없이 객체로 응답)
             try:
-                # ```json 및 ``` 제거
-                clean_text = response_text
-                if clean_text.startswith("```json"):
-                    clean_text = clean_text[7:]
-                if clean_text.startswith("```"):
-                    clean_text = clean_text[3:]
-                if clean_text.endswith("```"):
-                    clean_text = clean_text[:-3]
-                clean_text = clean_text.strip()
+                prompts = _PromptList.model_validate_json(response_text).prompts
                 
-                prompts = json.loads(clean_text)
-                
-                if isinstance(prompts, list) and len(prompts) == num_steps:
+                if len(prompts) == num_steps:
                     print(f"✅ Generated {len(prompts)} step prompts successfully")
                     return prompts
                 else:
-                    print(f"Invalid response format, expected {num_steps} prompts, got {len(prompts) if isinstance(prompts, list) else 'non-list'}")
+                    print(f"Invalid response format, expected {num_steps} prompts, got {len(prompts)}")
                     return self._generate_fallback_step_prompts(description, num_steps)
                     
-            except json.JSONDecodeError as e:
+            except ValidationError as e:
                 print(f"JSON decode error: {e}")
                 return self._generate_fallback_step_prompts(description, num_steps)
                 
@@ -242,34 +510,8 @@ JSON 배열 형태로 답변해주세요:
     
     def _generate_fallback_step_prompts(self, description: str, num_steps: int) -> List[str]:
         """Fallback 단계별 프롬프트 생성"""
-        # 사용자 설명을 기반으로 5단계 스토리 생성
-        if "박스" in description and "강아지" in description:
-            # 겨울 박스 구조 스토리
-            return [
-                "pet in box on snowy street",
-                "pet being discovered in box",
-                "pet being gently held",
-                "pet at warm home",
-                "pet playing happily indoors"
-            ]
-        elif "뛰어" in description or "달려" in description:
-            # 뛰어오는 스토리
-            return [
-                "pet sitting calmly",
-                "pet noticing something",
-                "pet starting to run",
-                "pet running joyfully",
-                "pet reaching destination"
-            ]
-        else:
-            # 기본 일상 스토리
-            return [
-                "pet resting peacefully",
-                "pet looking around curiously", 
-                "pet standing up",
-                "pet moving around",
-                "pet playing happily"
-            ] 
+        # 사용자 설명을 기반으로 5단계 스토리 선택
+        return list(_match_fallback(_STEP_FALLBACK_RULES, description, _DAILY_STEPS))
 
     async def generate_video_prompt_from_user_image(self, image_path: str, user_description: str) -> str:
         """
@@ -284,9 +526,8 @@ JSON 배열 형태로 답변해주세요:
         """
         
         try:
-            # 이미지를 base64로 인코딩
-            with open(image_path, "rb") as image_file:
-                base64_image = base64.b64encode(image_file.read()).decode('utf-8')
+            # 이미지를 base64 Data URL로 인코딩
+            data_url = await self._read_data_url(image_path)
             
             # OpenAI Vision API로 영상 프롬프트 생성 요청
             messages = [
@@ -318,7 +559,7 @@ JSON 배열 형태로 답변해주세요:
                         {
                             "type": "image_url",
                             "image_url": {
-                                "url": f"data:image/jpeg;base64,{base64_image}"
+                                "url": data_url
                             }
                         }
                     ]
@@ -329,7 +570,7 @@ JSON 배열 형태로 답변해주세요:
                 model="gpt-4o",
                 messages=messages,
                 temperature=0.7,
-                max_tokens=500
+                max_tokens=150  # 15-25단어 프롬프트 한 줄
             )
             
             video_prompt = response.choices[0].message.content.strip()
@@ -359,15 +600,14 @@ JSON 배열 형태로 답변해주세요:
             if num_images == 0:
                 return []
             
-            # 모든 이미지를 base64로 인코딩
-            image_data = []
-            for i, image_path in enumerate(image_paths):
-                with open(image_path, "rb") as image_file:
-                    base64_image = base64.b64encode(image_file.read()).decode('utf-8')
-                    image_data.append({
-                        "index": i + 1,
-                        "data": base64_image
-                    })
+            # 모든 이미지를 병렬로 base64 Data URL로 인코딩
+            encoded_images = await asyncio.gather(*[self._read_data_url(image_path) for image_path in image_paths])
+            image_data = [
+                {
+                    "index": i + 1,
+                    "data": data_url
+                } for i, data_url in enumerate(encoded_images)
+            ]
             
             # OpenAI Vision API로 스토리 기반 프롬프트 생성 요청
             content = [
@@ -388,8 +628,8 @@ JSON 배열 형태로 답변해주세요:
 예시 형식:
 "A lonely cardboard box sits on a snowy street under a lamppost on a freezing winter night. --ar 3:2 --style cinematic --v 6"
 
-JSON 배열 형태로 답변해주세요:
-["step1 midjourney prompt", "step2 midjourney prompt", ..., "step{num_images} midjourney prompt"]"""
+JSON 객체 형태로 답변해주세요:
+{{"prompts": ["step1 midjourney prompt", "step2 midjourney prompt", ..., "step{num_images} midjourney prompt"]}}"""
                 }
             ]
             
@@ -402,7 +642,7 @@ JSON 배열 형태로 답변해주세요:
                 content.append({
                     "type": "image_url",
                     "image_url": {
-                        "url": f"data:image/jpeg;base64,{img_data['data']}"
+                        "url": img_data['data']
                     }
                 })
             
@@ -417,34 +657,25 @@ JSON 배열 형태로 답변해주세요:
                 model="gpt-4o",
                 messages=messages,
                 temperature=0.7,
-                max_tokens=2000
+                max_tokens=120 * num_images + 50,  # 이미지당 25-35단어 + 미드저니 파라미터
+                response_format=_JSON_OBJECT
             )
             
             response_text = response.choices[0].message.content.strip()
             print(f"✅ Generated {num_images} story prompts: {response_text[:200]}...")
             
-            # JSON 마크다운 제거 및 파싱
+            # JSON 파싱 (JSON 모드라 코드 블록 없이 객체로 응답)
             try:
-                # ```json 및 ``` 제거
-                clean_text = response_text
-                if clean_text.startswith("```json"):
-                    clean_text = clean_text[7:]
-                if clean_text.startswith("```"):
-                    clean_text = clean_text[3:]
-                if clean_text.endswith("```"):
-                    clean_text = clean_text[:-3]
-                clean_text = clean_text.strip()
-                
-                prompts = json.loads(clean_text)
+                prompts = _PromptList.model_validate_json(response_text).prompts
                 
-                if isinstance(prompts, list) and len(prompts) == num_images:
+                if len(prompts) == num_images:
                     print(f"✅ Generated {len(prompts)} story prompts successfully")
                     return prompts
                 else:
-                    print(f"Invalid response format, expected {num_images} prompts, got {len(prompts) if isinstance(prompts, list) else 'non-list'}")
+                    print(f"Invalid response format, expected {num_images} prompts, got {len(prompts)}")
                     return self._generate_fallback_story_prompts(user_description, num_images)
                     
-            except json.JSONDecodeError as e:
+            except ValidationError as e:
                 print(f"JSON decode error: {e}")
                 return self._generate_fallback_story_prompts(user_description, num_images)
                 
@@ -454,39 +685,10 @@ JSON 배열 형태로 답변해주세요:
     
     def _generate_fallback_story_prompts(self, user_description: str, num_images: int) -> List[str]:
         """Fallback 스토리 프롬프트 생성"""
-        
-        # 기본 스토리 템플릿
-        if "구조" in user_description or "rescue" in user_description.lower():
-            # 구조 스토리
-            base_story = [
-                "A lonely cardboard box sits on a snowy street under a lamppost on a freezing winter night. --ar 3:2 --style cinematic --v 6",
-                "A person in warm winter clothes notices the box and approaches it slowly in the snow. --ar 3:2 --style cinematic --v 6", 
-                "The person carefully opens the box, revealing a frightened, shivering puppy inside. --ar 3:2 --style photorealistic --v 6",
-                "The person gently holds the cold puppy close, wrapping it warmly and walking away from the snow. --ar 3:2 --style cinematic --v 6",
-                "At home, the person hugs the puppy warmly under soft indoor lighting. --ar 3:2 --style cozy lighting --v 6",
-                "The puppy sits curled up in a corner of the room, looking nervous and unsure in the new place. --ar 3:2 --style warm tone --v 6",
-                "The puppy slowly begins to eat from a bowl, its body relaxed and more comfortable. --ar 3:2 --style domestic --v 6",
-                "The puppy happily plays with several toys scattered across a cozy living room carpet. --ar 3:2 --style playful --v 6",
-                "The puppy looks up at the person with a big smile, eyes full of trust and happiness. --ar 3:2 --style joyful --v 6",
-                "The puppy runs toward the camera, full of energy and joy, as if greeting its best friend. --ar 3:2 --style energetic --v 6"
-            ]
-        else:
-            # 일반적인 강아지 일상 스토리
-            base_story = [
-                "A cute dog sits peacefully in a beautiful outdoor setting with natural lighting. --ar 3:2 --style cinematic --v 6",
-                "The same dog begins to move around, exploring its surroundings with curiosity. --ar 3:2 --style photorealistic --v 6",
-                "The dog discovers something interesting and approaches it with excitement. --ar 3:2 --style cinematic --v 6", 
-                "The dog plays happily, showing joy and energy in a warm, inviting environment. --ar 3:2 --style playful --v 6",
-                "The dog interacts with its environment, displaying natural and endearing behavior. --ar 3:2 --style cozy lighting --v 6",
-                "The dog enjoys a peaceful moment, resting in a comfortable and safe place. --ar 3:2 --style warm tone --v 6",
-                "The dog shows affection and trust, creating a heartwarming scene. --ar 3:2 --style joyful --v 6",
-                "The dog engages in playful activity, demonstrating its personality and charm. --ar 3:2 --style domestic --v 6",
-                "The dog looks directly at the camera with a friendly and welcoming expression. --ar 3:2 --style energetic --v 6",
-                "The dog runs with pure joy and freedom, embodying happiness and vitality. --ar 3:2 --style cinematic --v 6"
-            ]
+        base_story = _match_fallback(_STORY_FALLBACK_RULES, user_description, _DAILY_STORY)
         
         # 요청된 이미지 수만큼 반환
-        return base_story[:num_images] 
+        return list(base_story[:num_images])
 
     async def generate_10_step_scene_descriptions(self, main_description: str, image_path: str = None) -> List[str]:
         """
@@ -504,20 +706,7 @@ JSON 배열 형태로 답변해주세요:
             messages = [
                 {
                     "role": "system", 
-                    "content": """You are a creative writing assistant that creates scene descriptions for image generation.
-
-Create 10 scene descriptions in English based on the user's story and uploaded image.
-
-Requirements:
-1. Analyze the uploaded image to understand the subject's characteristics
-2. Create 10 sequential scenes that tell a natural story
-3. Each scene should be 20-30 words in English
-4. Focus on actions, emotions, and environments
-5. Make scenes suitable for image generation
-6. Include these style parameters at the end of each prompt: --style raw --style photographic --v 6 --ar 9:16 consistent lighting
-
-Return as JSON array:
-["scene 1 description", "scene 2 description", ..., "scene 10 description"]"""
+                    "content": _TEN_STEP_SYSTEM_PROMPT
                 },
                 {
                     "role": "user",
@@ -530,7 +719,7 @@ Story: {main_description}
 
 Create 10 sequential scenes in English (20-30 words each) that tell a natural story based on the image and story above. Include --style raw --style photographic --v 6 --ar 9:16 consistent lighting at the end of each scene.
 
-Return as JSON array format."""
+Return as a JSON object with a "scenes" array."""
                         }
                     ]
                 }
@@ -539,14 +728,13 @@ Return as JSON array format."""
             # 이미지가 제공된 경우 분석에 포함
             if image_path and os.path.exists(image_path):
                 try:
-                    with open(image_path, "rb") as image_file:
-                        base64_image = base64.b64encode(image_file.read()).decode('utf-8')
+                    data_url = await self._read_data_url(image_path)
                     
                     # 이미지를 메시지에 추가
                     messages[1]["content"].append({
                         "type": "image_url",
                         "image_url": {
-                            "url": f"data:image/jpeg;base64,{base64_image}"
+                            "url": data_url
                         }
                     })
                     print(f"✅ 강아지 사진 분석을 위해 이미지 포함: {image_path}")
@@ -560,7 +748,8 @@ Return as JSON array format."""
                 model="gpt-4o",
                 messages=messages,
                 temperature=0.7,
-                max_tokens=1500
+                max_tokens=1000,  # 장면 10개 × (20-30단어 + 스타일 파라미터)
+                response_format=_JSON_OBJECT
             )
             
             response_text = response.choices[0].message.content.strip()
@@ -571,31 +760,21 @@ Return as JSON array format."""
                 print(f"⚠️ OpenAI refused the request, using fallback prompts")
                 return self._generate_fallback_midjourney_scenes(main_description)
             
-            # JSON 파싱
+            # JSON 파싱 (JSON 모드라 코드 블록 없이 객체로 응답)
             try:
-                # JSON 마크다운 제거
-                clean_text = response_text
-                if clean_text.startswith("```json"):
-                    clean_text = clean_text[7:]
-                if clean_text.startswith("```"):
-                    clean_text = clean_text[3:]
-                if clean_text.endswith("```"):
-                    clean_text = clean_text[:-3]
-                clean_text = clean_text.strip()
-                
-                scenes = json.loads(clean_text)
+                scenes = _SceneList.model_validate_json(response_text).scenes
                 
-                # 배열인지 확인하고 10개인지 체크
-                if isinstance(scenes, list) and len(scenes) == 10:
+                # 10개인지 체크 (문자열 배열인지는 모델 검증에서 확인)
+                if len(scenes) == 10:
                     print(f"✅ Generated 10 Midjourney-style prompts based on actual dog photo")
                     for i, scene in enumerate(scenes, 1):
                         print(f"Scene {i}: {scene[:80]}...")
                     return scenes
                 else:
-                    print(f"Warning: Expected 10 scenes, got {len(scenes) if isinstance(scenes, list) else 'non-list'}")
+                    print(f"Warning: Expected 10 scenes, got {len(scenes)}")
                     return self._generate_fallback_midjourney_scenes(main_description)
                     
-            except json.JSONDecodeError as e:
+            except ValidationError as e:
                 print(f"JSON decode error: {e}")
                 return self._generate_fallback_midjourney_scenes(main_description)
                 
@@ -605,31 +784,4 @@ Return as JSON array format."""
     
     def _generate_fallback_midjourney_scenes(self, main_description: str) -> List[str]:
         """10단계 미드저니 장면 생성 실패 시 폴백 장면들"""
-        base_style = "--style raw --style photographic --v 6 --ar 9:16 consistent lighting"
-        
-        if "강아지" in main_description and ("유치원" in main_description or "놀이" in main_description):
-            return [
-                f"A photorealistic cute puppy getting ready at home, looking excited with bright eyes and wagging tail, natural lighting, professional photography. {base_style}",
-                f"The same photorealistic puppy walking towards a colorful kindergarten building with other puppies visible in the background, lifelike detail. {base_style}",
-                f"The realistic puppy arriving at the kindergarten entrance, meeting friendly staff and other puppies for the first time, natural scene. {base_style}",
-                f"The photorealistic puppy cautiously exploring the kindergarten playground, sniffing around with curiosity and wonder, real dog behavior. {base_style}",
-                f"The realistic puppy starting to play with colorful toys scattered around the kindergarten play area, natural lighting. {base_style}",
-                f"The photorealistic puppy meeting and greeting other puppies, beginning to form new friendships through gentle interactions, lifelike. {base_style}",
-                f"The realistic puppy actively playing with other puppies, running around together in the safe kindergarten environment, natural motion. {base_style}",
-                f"The photorealistic puppy engaged in group play activities, showing joy and excitement while interacting with multiple puppies, real photo. {base_style}",
-                f"The realistic puppy and friends playing their favorite games together, showing pure happiness and playful energy, professional photography. {base_style}",
-                f"The tired but happy photorealistic puppy resting after playtime, surrounded by new friends in a peaceful moment, natural lighting. {base_style}"
-            ]
-        else:
-            return [
-                f"A photorealistic character preparing for an important journey or activity, showing determination and readiness, natural lighting. {base_style}",
-                f"The same realistic character taking the first steps toward their goal, moving with purpose and confidence, lifelike detail. {base_style}",
-                f"The photorealistic character arriving at their destination, taking in the new environment with curiosity, real photo style. {base_style}",
-                f"The realistic character beginning their main activity, showing focus and initial engagement, professional photography. {base_style}",
-                f"The photorealistic character becoming more involved in the activity, showing growing enthusiasm and skill, natural scene. {base_style}",
-                f"The realistic character interacting with others or elements in the environment, building connections, lifelike interaction. {base_style}",
-                f"The photorealistic character reaching a peak moment of activity, showing intense focus and energy, natural lighting. {base_style}",
-                f"The realistic character experiencing a breakthrough or special moment, radiating joy and accomplishment, real photo. {base_style}",
-                f"The photorealistic character completing their main activity with satisfaction and sense of achievement, professional photography. {base_style}",
-                f"The realistic character reflecting on the experience, showing contentment and peaceful completion, natural lighting. {base_style}"
-            ] 
\ No newline at end of file
+        return list(_match_fallback(_SCENE_FALLBACK_RULES, main_description, _GENERIC_SCENES))
@@ -1,18 +1,189 @@
 # app/services/openai_service.py
-from openai import AsyncOpenAI
-from typing import List, Dict, Tuple
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+from typing import AsyncIterator, List, Dict, Optional, Tuple
 import asyncio
 import os
 import base64
+import functools
+import hashlib
 import json
+import logging
+import re
 
-class OpenAIService:
-    def __init__(self):
+from .aiohttp_transport import AiohttpTransport
+
+logger = logging.getLogger(__name__)
+
+# 응답 전체가 마크다운 코드 블록(```json ... ```)으로 감싸진 경우 내용만 추출
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*\n?(.*?)\n?\s*```\s*$", re.DOTALL)
+
+def _parse_json(text: str):
+    """모델 응답 텍스트를 JSON으로 파싱 (코드 블록 표시는 제거)"""
+    m = _FENCE_RE.match(text)
+    return json.loads(m.group(1) if m else text)
+
+# 이미지/비디오 프롬프트 10쌍 응답 스키마 (Structured Outputs - 서버에서 형식을 강제하므로 파싱 실패가 없음)
+_SCENES_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "scenes": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "image": {"type": "string"},
+                    "video": {"type": "string"}
+                },
+                "required": ["image", "video"],
+                "additionalProperties": False
+            }
+        }
+    },
+    "required": ["scenes"],
+    "additionalProperties": False
+}
+_SCENES_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "scenes", "schema": _SCENES_SCHEMA, "strict": True}
+}
+# 스트리밍 중 완성된 장면 객체 하나 ({"image": "...", "video": "..."}) - 문자열은 JSON 이스케이프 그대로 캡처
+_SCENE_PAIR_RE = re.compile(r'\{\s*"image"\s*:\s*("(?:[^"\\]|\\.)*")\s*,\s*"video"\s*:\s*("(?:[^"\\]|\\.)*")\s*\}')
+_SCENES_MODEL = "gpt-4o"
+_SCENES_TEMPERATURE = 0.7
+# 출력 토큰 상한 - 장면 10개 × 프롬프트 2개(15-25단어 ≈ 35토큰) + 장면당 JSON 구조 약 12토큰 ≈ 830토큰에 여유를 둔 값
+_SCENES_MAX_TOKENS = 1000
+
+# 강아지 분석 결과를 함수 호출 인자로 받기 위한 도구 정의 (strict - 모든 필드가 스키마대로 채워짐)
+_DOG_ANALYSIS_TOOL = {
+    "type": "function",
+    "function": {
+        "name": "report_dog_analysis",
+        "description": "Report the analysis of the dog in the image",
+        "strict": True,
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "breed": {"type": "string", "description": "Dog breed name"},
+                "characteristics": {"type": "array", "items": {"type": "string"}, "description": "Three notable characteristics"},
+                "size": {"type": "string", "enum": ["small", "medium", "large"]},
+                "color": {"type": "string", "description": "Primary color description"},
+                "age_estimate": {"type": "string", "enum": ["puppy", "young", "adult", "senior"]},
+                "temperament": {"type": "string", "description": "calm/energetic/playful/etc"},
+                "confidence": {"type": "number", "description": "Confidence between 0 and 1"}
+            },
+            "required": ["breed", "characteristics", "size", "color", "age_estimate", "temperament", "confidence"],
+            "additionalProperties": False
+        }
+    }
+}
+_DOG_ANALYSIS_TOOL_CHOICE = {"type": "function", "function": {"name": "report_dog_analysis"}}
+
+# 시스템 프롬프트는 content_type별로 고정 - 한 번만 만들고, 요청마다 달라지는 내용(강아지 분석, 설명)은
+# 사용자 메시지로 보내 앞부분이 매번 동일하게 유지되도록 함 (OpenAI 프롬프트 캐시는 접두사 일치 기준)
+@functools.lru_cache(maxsize=8)
+def _prompts_system_prompt(content_type: str) -> str:
+    return f"""You are an expert at creating prompts for AI image and video generation.
+
+Create exactly 10 image prompts and 10 corresponding video prompts based on the user's description.
+
+Content Type: {content_type}
+- If "life" (일상생활): Focus on daily life activities
+- If "cooking" (요리): Focus on cooking and food preparation  
+- If "travel" (여행): Focus on travel and exploration
+
+Requirements:
+1. Create 10 detailed image prompts that show different scenes/moments
+2. Create 10 corresponding video prompts that animate those images
+3. Image prompts should be static scenes, 15-25 words each
+4. Video prompts should describe movement and animation, 15-25 words each
+5. Both should work together as a cohesive sequence
+
+Return exactly 10 scenes, each pairing an image prompt with its video prompt:
+{{
+    "scenes": [{{"image": "image prompt 1", "video": "video prompt 1"}}, ...]
+}}"""
+
+@functools.lru_cache(maxsize=8)
+def _custom_dog_system_prompt(content_type: str) -> str:
+    return f"""You are an expert at creating prompts for AI image and video generation with custom dogs.
+
+Create exactly 10 image prompts and 10 corresponding video prompts based on the user's description and the specific dog analysis given with it.
+
+Content Type: {content_type}
+
+Requirements:
+1. Use the specific dog breed from the dog analysis
+2. Incorporate the dog's characteristics
+3. Consider the dog's size
+4. Include the dog's color
+5. Match the dog's temperament
+6. Create 10 detailed image prompts (static scenes, 15-25 words each)
+7. Create 10 corresponding video prompts (movement and animation, 15-25 words each)
+8. Both should work together as a cohesive sequence
+
+Return exactly 10 scenes, each pairing an image prompt with its video prompt:
+{{
+    "scenes": [{{"image": "image prompt 1", "video": "video prompt 1"}}, ...]
+}}"""
+
+# 프로세스 전체에서 공유하는 클라이언트 - 서비스 인스턴스가 여러 개여도 연결 풀(keep-alive/TLS)을 한 번만 만듦
+_CLIENT: Optional[AsyncOpenAI] = None
+
+def _get_client() -> Optional[AsyncOpenAI]:
+    """공유 AsyncOpenAI 클라이언트 (API 키가 없으면 None)"""
+    global _CLIENT
+    if _CLIENT is None:
         api_key = os.getenv("OPENAI_API_KEY")
         if api_key:
-            self.client = AsyncOpenAI(api_key=api_key)
-        else:
-            self.client = None
+            # 실제 송수신은 aiohttp 커넥터로 (동시 요청이 하나의 keep-alive 연결 풀을 공유, SDK 기본 타임아웃은 유지)
+            http_client = DefaultAsyncHttpxClient(
+                transport=AiohttpTransport(limit=100, keepalive_timeout=60)
+            )
+            # 429/5xx/연결 오류는 SDK가 Retry-After 헤더를 따르는 지수 백오프(지터 포함)로 재시도 - 기본 2회에서 5회로
+            _CLIENT = AsyncOpenAI(api_key=api_key, http_client=http_client, max_retries=5)
+    return _CLIENT
+
+async def close_client():
+    """공유 클라이언트와 aiohttp 연결 종료 (앱 종료 시 또는 스크립트의 asyncio.run이 끝나기 전에 호출)"""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.close()
+        _CLIENT = None
+
+class OpenAIService:
+    def __init__(self):
+        self.client = _get_client()
+        # 진행 중인 동일 프롬프트 생성 요청 - 동시에 같은 입력이 오면 API를 한 번만 호출
+        # (temperature 0.7이라 완료된 결과는 보관하지 않음 - 다시 생성하면 새 프롬프트)
+        self._prompt_inflight: Dict[Tuple, asyncio.Future] = {}
+
+    async def _stream_scene_pairs(self, messages: List[Dict]) -> AsyncIterator[Tuple[str, str]]:
+        """장면 응답을 스트리밍으로 받아 (이미지, 비디오) 프롬프트 쌍이 완성되는 대로 반환"""
+        stream = await self.client.chat.completions.create(
+            model=_SCENES_MODEL,
+            messages=messages,
+            temperature=_SCENES_TEMPERATURE,
+            max_tokens=_SCENES_MAX_TOKENS,
+            response_format=_SCENES_RESPONSE_FORMAT,
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+        response_text = ""
+        pos = 0
+        try:
+            async for chunk in stream:
+                if chunk.usage:
+                    logger.debug("Prompt generation used %s completion tokens", chunk.usage.completion_tokens)
+                if not chunk.choices or not chunk.choices[0].delta.content:
+                    continue
+                response_text += chunk.choices[0].delta.content
+                # 이번 조각으로 닫힌 장면 객체만 꺼냄 (나머지는 다음 조각에서 이어서 검사)
+                while (m := _SCENE_PAIR_RE.search(response_text, pos)):
+                    pos = m.end()
+                    yield json.loads(m.group(1)), json.loads(m.group(2))
+        finally:
+            await stream.close()
+        logger.debug("Generated prompts response: %.200s...", response_text)
             
     async def analyze_dog_image(self, image_path: str) -> Dict:
         """강아지 이미지 분석"""
@@ -25,18 +196,7 @@ class OpenAIService:
                 {
                     "role": "system",
                     "content": """You are an expert dog breed identifier and analyst.
-Analyze the provided dog image and return detailed information about the dog.
-
-Respond with ONLY a JSON object in this format:
-{
-    "breed": "Dog breed name",
-    "characteristics": ["characteristic1", "characteristic2", "characteristic3"],
-    "size": "small/medium/large",
-    "color": "primary color description",
-    "age_estimate": "puppy/young/adult/senior",
-    "temperament": "calm/energetic/playful/etc",
-    "confidence": 0.85
-}"""
+Analyze the provided dog image and report detailed information about the dog with the report_dog_analysis tool."""
                 },
                 {
                     "role": "user",
@@ -59,25 +219,17 @@ Respond with ONLY a JSON object in this format:
                 model="gpt-4o",
                 messages=messages,
                 temperature=0.3,
-                max_tokens=300
+                max_tokens=300,
+                tools=[_DOG_ANALYSIS_TOOL],
+                tool_choice=_DOG_ANALYSIS_TOOL_CHOICE
             )
             
-            response_text = response.choices[0].message.content.strip()
-            print(f"Dog analysis response: {response_text}")
+            # 도구 호출 인자로 구조화된 결과를 받으므로 텍스트 파싱이 필요 없음
+            arguments = response.choices[0].message.tool_calls[0].function.arguments
+            logger.debug("Dog analysis response: %s", arguments)
             
-            # JSON 마크다운 제거 및 파싱
             try:
-                # ```json 및 ``` 제거
-                clean_text = response_text
-                if clean_text.startswith("```json"):
-                    clean_text = clean_text[7:]  # ```json 제거
-                if clean_text.startswith("```"):
-                    clean_text = clean_text[3:]   # ``` 제거
-                if clean_text.endswith("```"):
-                    clean_text = clean_text[:-3]  # 끝의 ``` 제거
-                clean_text = clean_text.strip()
-                
-                dog_analysis = json.loads(clean_text)
+                dog_analysis = json.loads(arguments)
                 return dog_analysis
             except json.JSONDecodeError:
                 # Fallback 분석 결과
@@ -92,7 +244,7 @@ Respond with ONLY a JSON object in this format:
                 }
                 
         except Exception as e:
-            print(f"Error analyzing dog image: {e}")
+            logger.warning("Error analyzing dog image: %s", e)
             # Fallback 분석 결과
             return {
                 "breed": "Mixed Breed",
@@ -173,23 +325,11 @@ First analyze the dog, then return ONLY a JSON object in this format:
             )
             
             response_text = response.choices[0].message.content.strip()
-            print(f"OpenAI image+prompt response: {response_text[:300]}...")
+            logger.debug("OpenAI image+prompt response: %.300s...", response_text)
             
             # JSON 마크다운 제거 및 파싱
             try:
-                # ```json 및 ``` 제거
-                clean_text = response_text
-                if clean_text.startswith("```json"):
-                    clean_text = clean_text[7:]  # ```json 제거
-                if clean_text.startswith("```"):
-                    clean_text = clean_text[3:]   # ``` 제거
-                if clean_text.endswith("```"):
-                    clean_text = clean_text[:-3]  # 끝의 ``` 제거
-                clean_text = clean_text.strip()
-                
-                print(f"Cleaned JSON: {clean_text[:200]}...")
-                
-                result = json.loads(clean_text)
+                result = _parse_json(response_text)
                 dog_analysis = result.get("dog_analysis", {})
                 image_prompts = result.get("image_prompts", [])
                 video_prompts = result.get("video_prompts", [])
@@ -199,21 +339,21 @@ First analyze the dog, then return ONLY a JSON object in this format:
                     isinstance(dog_analysis, dict)):
                     return dog_analysis, image_prompts, video_prompts
                 else:
-                    print(f"Invalid response format, expected 3 image and 3 video prompts with dog analysis")
+                    logger.warning("Invalid response format, expected 3 image and 3 video prompts with dog analysis")
                     # Fallback: 기본 분석 후 3단계 생성
                     dog_analysis = await self.analyze_dog_image(dog_image_path)
                     fallback_img, fallback_vid = self._generate_fallback_video_sequence_with_images_test(description, content_type, dog_analysis)
                     return dog_analysis, fallback_img, fallback_vid
                     
             except json.JSONDecodeError as e:
-                print(f"JSON decode error: {e}")
+                logger.warning("JSON decode error: %s", e)
                 # Fallback: 기본 분석 후 3단계 생성
                 dog_analysis = await self.analyze_dog_image(dog_image_path)
                 fallback_img, fallback_vid = self._generate_fallback_video_sequence_with_images_test(description, content_type, dog_analysis)
                 return dog_analysis, fallback_img, fallback_vid
                 
         except Exception as e:
-            print(f"Error in image+prompt generation: {e}")
+            logger.warning("Error in image+prompt generation: %s", e)
             # Fallback: 기본 분석 후 3단계 생성
             dog_analysis = await self.analyze_dog_image(dog_image_path)
             fallback_img, fallback_vid = self._generate_fallback_video_sequence_with_images_test(description, content_type, dog_analysis)
@@ -273,7 +413,7 @@ First analyze the dog, then return ONLY a JSON object in this format:
                             "data": base64_image
                         })
                 except Exception as e:
-                    print(f"Error loading image {i}: {e}")
+                    logger.warning("Error loading image %d: %s", i, e)
                     continue
             
             if not image_data_list:
@@ -325,21 +465,11 @@ Respond with ONLY a JSON object in this format:
             )
             
             response_text = response.choices[0].message.content.strip()
-            print(f"Image selection response: {response_text}")
+            logger.debug("Image selection response: %s", response_text)
             
             # JSON 마크다운 제거 및 파싱
             try:
-                # ```json 및 ``` 제거
-                clean_text = response_text
-                if clean_text.startswith("```json"):
-                    clean_text = clean_text[7:]  # ```json 제거
-                if clean_text.startswith("```"):
-                    clean_text = clean_text[3:]   # ``` 제거
-                if clean_text.endswith("```"):
-                    clean_text = clean_text[:-3]  # 끝의 ``` 제거
-                clean_text = clean_text.strip()
-                
-                result = json.loads(clean_text)
+                result = _parse_json(response_text)
                 selected_index = result.get("selected_index", 0)
                 reason = result.get("reason", "AI selected this image as most suitable")
                 
@@ -353,7 +483,7 @@ Respond with ONLY a JSON object in this format:
                 return 0, "Failed to parse selection response, using first image"
                 
         except Exception as e:
-            print(f"Error in image selection: {e}")
+            logger.warning("Error in image selection: %s", e)
             return 0, f"Error during selection: {str(e)}, using first image"
 
     async def analyze_image_and_optimize_video_prompt(self, image_path: str, original_prompt: str, project_description: str, content_type: str) -> str:
@@ -420,84 +550,68 @@ Return ONLY the optimized prompt text, no explanation."""
             return optimized_prompt
             
         except Exception as e:
-            print(f"Error optimizing video prompt: {e}")
+            logger.warning("Error optimizing video prompt: %s", e)
             # Fallback: 원본 프롬프트에 기본 최적화 적용
             return f"Cinematic view with natural movement: {original_prompt}"
 
+    async def stream_image_and_video_prompts(self, description: str, content_type: str) -> AsyncIterator[Tuple[str, str]]:
+        """클래식 워크플로우용: (이미지 프롬프트, 비디오 프롬프트) 쌍을 생성되는 대로 하나씩 반환
+
+        첫 장면이 완성되면 바로 받을 수 있어 이미지/비디오 생성을 LLM 응답이 끝나기 전에 시작 가능
+        (API 오류는 호출한 쪽으로 전달됨)
+        """
+        messages = [
+            {
+                "role": "system",
+                "content": _prompts_system_prompt(content_type)
+            },
+            {
+                "role": "user",
+                "content": f"Create 10 image prompts and 10 video prompts for: {description}"
+            }
+        ]
+        
+        async for pair in self._stream_scene_pairs(messages):
+            yield pair
+
     async def generate_image_and_video_prompts(self, description: str, content_type: str) -> Tuple[List[str], List[str]]:
         """클래식 워크플로우용: 이미지 프롬프트와 비디오 프롬프트를 분리해서 생성"""
         
-        try:
-            messages = [
-                {
-                    "role": "system",
-                    "content": f"""You are an expert at creating prompts for AI image and video generation.
-
-Create exactly 10 image prompts and 10 corresponding video prompts based on the user's description.
-
-Content Type: {content_type}
-- If "life" (일상생활): Focus on daily life activities
-- If "cooking" (요리): Focus on cooking and food preparation  
-- If "travel" (여행): Focus on travel and exploration
-
-Requirements:
-1. Create 10 detailed image prompts that show different scenes/moments
-2. Create 10 corresponding video prompts that animate those images
-3. Image prompts should be static scenes, 15-25 words each
-4. Video prompts should describe movement and animation, 15-25 words each
-5. Both should work together as a cohesive sequence
-
-Return ONLY a JSON object in this format:
-{{
-    "image_prompts": ["prompt1", "prompt2", ...],
-    "video_prompts": ["prompt1", "prompt2", ...]
-}}"""
-                },
-                {
-                    "role": "user",
-                    "content": f"Create 10 image prompts and 10 video prompts for: {description}"
-                }
-            ]
-            
-            response = await self.client.chat.completions.create(
-                model="gpt-4o",
-                messages=messages,
-                temperature=0.7,
-                max_tokens=1500
-            )
-            
-            response_text = response.choices[0].message.content.strip()
-            print(f"Generated prompts response: {response_text[:200]}...")
-            
-            # JSON 마크다운 제거 및 파싱
+        key = (content_type, hashlib.sha256(description.encode("utf-8")).hexdigest(), _SCENES_MODEL, _SCENES_TEMPERATURE)
+        result = None
+        if key in self._prompt_inflight:
+            # 같은 요청이 이미 진행 중이면 그 결과를 함께 사용
+            result = await asyncio.shield(self._prompt_inflight[key])
+        else:
+            future = asyncio.get_running_loop().create_future()
+            self._prompt_inflight[key] = future
             try:
-                # ```json 및 ``` 제거
-                clean_text = response_text
-                if clean_text.startswith("```json"):
-                    clean_text = clean_text[7:]  # ```json 제거
-                if clean_text.startswith("```"):
-                    clean_text = clean_text[3:]   # ``` 제거
-                if clean_text.endswith("```"):
-                    clean_text = clean_text[:-3]  # 끝의 ``` 제거
-                clean_text = clean_text.strip()
-                
-                result = json.loads(clean_text)
-                image_prompts = result.get("image_prompts", [])
-                video_prompts = result.get("video_prompts", [])
-                
-                if len(image_prompts) == 10 and len(video_prompts) == 10:
-                    return image_prompts, video_prompts
-                else:
-                    print(f"Invalid prompt counts: {len(image_prompts)} image, {len(video_prompts)} video")
-                    return self._generate_fallback_prompts(description, content_type)
-                    
-            except json.JSONDecodeError as e:
-                print(f"JSON decode error: {e}")
-                return self._generate_fallback_prompts(description, content_type)
+                result = await self._request_image_and_video_prompts(description, content_type)
+            finally:
+                del self._prompt_inflight[key]
+                # 이 요청이 취소되어도 기다리던 요청이 멈추지 않도록 결과 전달 (없으면 None - 각자 fallback)
+                future.set_result(result)
+        
+        if result is None:
+            return self._generate_fallback_prompts(description, content_type)
+        # 함께 기다린 요청과 결과를 공유하므로 호출한 쪽에는 새 리스트로 반환
+        return list(result[0]), list(result[1])
+
+    async def _request_image_and_video_prompts(self, description: str, content_type: str) -> Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]]:
+        """프롬프트 10쌍 요청 (실패하거나 개수가 맞지 않으면 None)"""
+        try:
+            pairs = [pair async for pair in self.stream_image_and_video_prompts(description, content_type)]
+            
+            if len(pairs) == 10:
+                image_prompts, video_prompts = zip(*pairs)
+                return image_prompts, video_prompts
+            else:
+                logger.warning("Invalid prompt counts: %d scenes", len(pairs))
+                return None
                 
         except Exception as e:
-            print(f"Error generating prompts: {e}")
-            return self._generate_fallback_prompts(description, content_type)
+            logger.warning("Error generating prompts: %s", e)
+            return None
 
     def _generate_fallback_prompts(self, description: str, content_type: str) -> Tuple[List[str], List[str]]:
         """Fallback 프롬프트 생성"""
@@ -525,73 +639,32 @@ Return ONLY a JSON object in this format:
             messages = [
                 {
                     "role": "system",
-                    "content": f"""You are an expert at creating prompts for AI image and video generation with custom dogs.
-
-Create exactly 10 image prompts and 10 corresponding video prompts based on the user's description and the specific dog analysis.
-
-Dog Analysis: {dog_analysis}
-Content Type: {content_type}
-
-Requirements:
-1. Use the specific dog breed: {dog_analysis.get('breed', 'dog')}
-2. Incorporate the dog's characteristics: {', '.join(dog_analysis.get('characteristics', []))}
-3. Consider the dog's size: {dog_analysis.get('size', 'medium')}
-4. Include the dog's color: {dog_analysis.get('color', 'brown')}
-5. Match the dog's temperament: {dog_analysis.get('temperament', 'playful')}
-6. Create 10 detailed image prompts (static scenes, 15-25 words each)
-7. Create 10 corresponding video prompts (movement and animation, 15-25 words each)
-8. Both should work together as a cohesive sequence
-
-Return ONLY a JSON object in this format:
-{{
-    "image_prompts": ["prompt1", "prompt2", ...],
-    "video_prompts": ["prompt1", "prompt2", ...]
-}}"""
+                    "content": _custom_dog_system_prompt(content_type)
                 },
                 {
                     "role": "user",
-                    "content": f"Create 10 image prompts and 10 video prompts for this {dog_analysis.get('breed', 'dog')}: {description}"
+                    "content": f"""Dog Analysis: {dog_analysis}
+- Breed: {dog_analysis.get('breed', 'dog')}
+- Characteristics: {', '.join(dog_analysis.get('characteristics', []))}
+- Size: {dog_analysis.get('size', 'medium')}
+- Color: {dog_analysis.get('color', 'brown')}
+- Temperament: {dog_analysis.get('temperament', 'playful')}
+
+Create 10 image prompts and 10 video prompts for this {dog_analysis.get('breed', 'dog')}: {description}"""
                 }
             ]
             
-            response = await self.client.chat.completions.create(
-                model="gpt-4o",
-                messages=messages,
-                temperature=0.7,
-                max_tokens=1500
-            )
-            
-            response_text = response.choices[0].message.content.strip()
-            print(f"Generated custom dog prompts response: {response_text[:200]}...")
+            pairs = [pair async for pair in self._stream_scene_pairs(messages)]
             
-            # JSON 마크다운 제거 및 파싱
-            try:
-                # ```json 및 ``` 제거
-                clean_text = response_text
-                if clean_text.startswith("```json"):
-                    clean_text = clean_text[7:]  # ```json 제거
-                if clean_text.startswith("```"):
-                    clean_text = clean_text[3:]   # ``` 제거
-                if clean_text.endswith("```"):
-                    clean_text = clean_text[:-3]  # 끝의 ``` 제거
-                clean_text = clean_text.strip()
-                
-                result = json.loads(clean_text)
-                image_prompts = result.get("image_prompts", [])
-                video_prompts = result.get("video_prompts", [])
-                
-                if len(image_prompts) == 10 and len(video_prompts) == 10:
-                    return image_prompts, video_prompts
-                else:
-                    print(f"Invalid prompt counts: {len(image_prompts)} image, {len(video_prompts)} video")
-                    return self._generate_fallback_custom_dog_prompts(description, dog_analysis, content_type)
-                    
-            except json.JSONDecodeError as e:
-                print(f"JSON decode error: {e}")
+            if len(pairs) == 10:
+                image_prompts, video_prompts = (list(prompts) for prompts in zip(*pairs))
+                return image_prompts, video_prompts
+            else:
+                logger.warning("Invalid prompt counts: %d scenes", len(pairs))
                 return self._generate_fallback_custom_dog_prompts(description, dog_analysis, content_type)
                 
         except Exception as e:
-            print(f"Error generating custom dog prompts: {e}")
+            logger.warning("Error generating custom dog prompts: %s", e)
             return self._generate_fallback_custom_dog_prompts(description, dog_analysis, content_type)
 
     def _generate_fallback_custom_dog_prompts(self, description: str, dog_analysis: Dict, content_type: str) -> Tuple[List[str], List[str]]:
@@ -0,0 +1,36 @@
+# app/services/rate_limiter.py
+import asyncio
+import time
+
+class AsyncLimiter:
+    """토큰 버킷 방식 비동기 속도 제한기 - time_period(초) 동안 최대 max_rate회 허용"""
+
+    def __init__(self, max_rate: float, time_period: float = 60):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._rate_per_sec = max_rate / time_period
+        self._tokens = float(max_rate)  # 처음에는 버킷이 가득 찬 상태
+        self._last_refill = time.monotonic()
+
+    def _refill(self):
+        """경과 시간만큼 토큰 보충 (최대 max_rate)"""
+        now = time.monotonic()
+        self._tokens = min(self.max_rate, self._tokens + (now - self._last_refill) * self._rate_per_sec)
+        self._last_refill = now
+
+    async def acquire(self, amount: float = 1):
+        """토큰을 얻을 때까지 대기"""
+        while True:
+            self._refill()
+            if self._tokens >= amount:
+                self._tokens -= amount
+                return
+            # 부족한 토큰이 채워질 때까지만 대기
+            await asyncio.sleep((amount - self._tokens) / self._rate_per_sec)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False